@@ -1,9 +1,12 @@
 from .basic_local_savegames import BasicLocalSavegames
 from .basic_mod_data_checker import BasicModDataChecker, GlobPatterns
+from .basic_mod_data_content import BasicModDataContent, ContentRule
 from .basic_save_game_info import BasicGameSaveGameInfo
 
 __all__ = [
     "BasicModDataChecker",
+    "BasicModDataContent",
+    "ContentRule",
     "BasicGameSaveGameInfo",
     "GlobPatterns",
     "BasicLocalSavegames",
@@ -3,7 +3,7 @@ from __future__ import annotations
 import fnmatch
 import re
 from dataclasses import dataclass, field
-from typing import Iterable, Literal
+from typing import Callable, Iterable, Iterator, Literal
 
 import mobase
 
@@ -37,6 +37,66 @@ class OptionalRegexPattern:
         return bool(self._pattern.match(value))
 
 
+PatternCategory = Literal["ignore", "unfold", "valid", "delete", "move"]
+PatternClass = tuple[PatternCategory, str | None] | None
+
+EntryCategory = PatternCategory | Literal["descend"]
+EntryClass = tuple[EntryCategory, str | None] | None
+"""Class of a tree entry, `descend` for directories handled by deeper patterns."""
+
+
+class PatternNode:
+    """
+    Node of the segment trie of the glob patterns, with the patterns ending at this
+    depth and the branches towards the deeper ones.
+    """
+
+    def __init__(self) -> None:
+        self._globs: list[tuple[int, str, PatternClass]] = []
+        self._children: dict[str, PatternNode] = {}
+
+        self._pattern: re.Pattern[str] | None = None
+        self._classes: list[tuple[int, PatternClass]] = []
+        self.branches: list[tuple[re.Pattern[str], PatternNode]] = []
+
+    def add(self, segments: list[str], priority: int, pattern_class: PatternClass):
+        if len(segments) == 1:
+            self._globs.append((priority, segments[0], pattern_class))
+        else:
+            child = self._children.setdefault(segments[0].casefold(), PatternNode())
+            child.add(segments[1:], priority, pattern_class)
+
+    def compile(self):
+        if self._globs:
+            # the globs are added by priority so the first match has the lowest one
+            self._pattern = OptionalRegexPattern.regex_from_glob_list(
+                glob for _, glob, _ in self._globs
+            )
+        self._classes = [(priority, cls) for priority, _, cls in self._globs]
+        self.branches = [
+            (re.compile(fnmatch.translate(segment), re.I), child)
+            for segment, child in self._children.items()
+        ]
+        for child in self._children.values():
+            child.compile()
+
+    def match(self, value: str) -> tuple[int, PatternClass] | None:
+        """
+        Retrieve the (priority, class) of the first pattern ending at this node that
+        matches the given value.
+        """
+        if self._pattern is None:
+            return None
+        match = self._pattern.match(value)
+        if match is None or match.lastindex is None:
+            return None
+        return self._classes[match.lastindex - 1]
+
+
+PatternState = tuple[PatternNode, ...]
+"""Nodes of the pattern trie active for the entries of a tree."""
+
+
 class RegexPatterns:
     """
     Regex patterns for validation in `BasicModDataChecker`.
@@ -52,6 +112,63 @@ class RegexPatterns:
         }
         self.ignore = OptionalRegexPattern(globs.ignore)
 
+        # all the patterns, split on path separators, in a segment trie where each
+        # node matches the patterns ending there with a single regex
+        categories: list[tuple[PatternCategory, list[str] | None]] = [
+            ("ignore", globs.ignore),
+            ("unfold", globs.unfold),
+            ("valid", globs.valid),
+            ("delete", globs.delete),
+        ]
+        patterns: list[tuple[str, PatternClass]] = [
+            (glob, (category, None))
+            for category, category_globs in categories
+            for glob in category_globs or ()
+        ]
+        patterns.extend((key, ("move", target)) for key, target in globs.move.items())
+
+        self.root = PatternNode()
+        for priority, (glob, pattern_class) in enumerate(patterns):
+            self.root.add(re.split(r"[/\\]", glob), priority, pattern_class)
+        self.root.compile()
+        self.root_state: PatternState = (self.root,)
+
+    def classify(self, value: str, state: PatternState | None = None) -> PatternClass:
+        """
+        Retrieve the category of the first pattern matching the given value, in
+        `ignore`, `unfold`, `valid`, `delete`, `move` order, with the move target for
+        `move`, or None if no pattern matches.
+
+        Args:
+            value: Name of the entry.
+            state (optional): Trie nodes for the parent of the entry, see `descend()`,
+                defaults to the root (patterns without separators).
+        """
+        if state is None:
+            state = self.root_state
+        if len(state) == 1:
+            match = state[0].match(value)
+            return None if match is None else match[1]
+
+        best: tuple[int, PatternClass] | None = None
+        for node in state:
+            match = node.match(value)
+            if match is not None and (best is None or match[0] < best[0]):
+                best = match
+        return None if best is None else best[1]
+
+    def descend(self, state: PatternState, value: str) -> PatternState:
+        """
+        Retrieve the trie nodes for the entries of the directory with the given name,
+        empty if no pattern goes deeper.
+        """
+        return tuple(
+            child
+            for node in state
+            for pattern, child in node.branches
+            if pattern.match(value)
+        )
+
     def move_match(self, value: str) -> str | None:
         """
         Retrieve the first move patterns that matches the given value, or None if no
@@ -63,6 +180,37 @@ class RegexPatterns:
         return None
 
 
+class CheckPlan:
+    """
+    Classification of the entries of a tree, computed lazily and shared by the
+    checks of the tree and of its parents, and between
+    `BasicModDataChecker.dataLooksValid()` and `BasicModDataChecker.fix()`.
+    """
+
+    def __init__(
+        self,
+        tree: mobase.IFileTree,
+        entries: list[mobase.FileTreeEntry],
+        names: list[str],
+        state: PatternState,
+        classify: Callable[[mobase.FileTreeEntry, str, PatternState], EntryClass],
+    ) -> None:
+        self.tree = tree
+        self.entries = entries
+        self.names = names
+        self.state = state
+        self.status: mobase.ModDataChecker.CheckReturn | None = None
+        self._classify = classify
+        self._classes: list[EntryClass] = []
+
+    def __iter__(self) -> Iterator[tuple[mobase.FileTreeEntry, EntryClass]]:
+        classes = self._classes
+        for index, entry in enumerate(self.entries):
+            if index == len(classes):
+                classes.append(self._classify(entry, self.names[index], self.state))
+            yield entry, classes[index]
+
+
 def _merge_list(l1: list[str] | None, l2: list[str] | None) -> list[str] | None:
     if l1 is None and l2 is None:
         return None
@@ -124,8 +272,13 @@ class BasicModDataChecker(mobase.ModDataChecker):
     """Game feature that is used to check and fix the content of a data tree
     via simple file definitions.
 
-    The file definitions support glob pattern (without subfolders) and are
-    checked and fixed in definition order of the `file_patterns` dict.
+    The file definitions support glob pattern and are checked and fixed in
+    definition order of the `file_patterns` dict.
+
+    Patterns can contain subfolders (e.g. `"Mods/*.pak"` or `"*/Public"`), each
+    segment matching a single entry name. A folder that matches no pattern by
+    itself, or that would be deleted or moved, is checked and fixed recursively
+    when its content matches such deeper patterns.
 
     Args:
         file_patterns (optional): A GlobPatterns object, with the following attributes:
@@ -166,61 +319,154 @@ class BasicModDataChecker(mobase.ModDataChecker):
     _regex_patterns: RegexPatterns
     """The regex patterns derived from the file (glob) patterns."""
 
+    _plans: dict[int, CheckPlan]
+    """Check plans of the trees of `_plans_root`, by tree id."""
+
+    _plans_root: mobase.IFileTree | None
+    """Tree of the last top-level `dataLooksValid()` or `fix()` call, its plans are
+    kept for the next call, e.g. `fix()` after `dataLooksValid()`."""
+
+    _depth: int
+    """Number of nested `dataLooksValid()` and `fix()` calls."""
+
     def __init__(self, file_patterns: GlobPatterns | None = None):
         super().__init__()
 
         self._file_patterns = file_patterns or GlobPatterns()
         self._regex_patterns = RegexPatterns(self._file_patterns)
+        self._plans = {}
+        self._plans_root = None
+        self._depth = 0
+
+    def check_plan(
+        self, filetree: mobase.IFileTree, state: PatternState | None = None
+    ) -> CheckPlan:
+        """
+        Retrieve the check plan of the given tree, reusing the one from a previous
+        call unless the entries of the tree changed.
+
+        Args:
+            filetree: The tree to check.
+            state (optional): Trie nodes for the entries of the tree, defaults to the
+                root ones.
+        """
+        if state is None:
+            state = self._regex_patterns.root_state
+        entries = list(filetree)
+        names = [entry.name() for entry in entries]
+        plan = self._plans.get(id(filetree))
+        if (
+            plan is None
+            or plan.tree is not filetree
+            or plan.state != state
+            or plan.names != names
+        ):
+            plan = CheckPlan(filetree, entries, names, state, self._classify)
+            self._plans[id(filetree)] = plan
+        return plan
+
+    def _classify(
+        self, entry: mobase.FileTreeEntry, name: str, state: PatternState
+    ) -> EntryClass:
+        rp = self._regex_patterns
+        name = name.casefold()
+        pattern_class = rp.classify(name, state)
+        if pattern_class is None or pattern_class[0] in ("delete", "move"):
+            # deeper patterns are more specific, they take precedence if they match
+            # the content of the directory
+            if is_directory(entry) and (substate := rp.descend(state, name)):
+                if self._check(entry, substate) is not mobase.ModDataChecker.INVALID:
+                    return ("descend", None)
+        return pattern_class
 
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
-        status = mobase.ModDataChecker.INVALID
+        self._begin_call(filetree)
+        try:
+            return self._check(filetree, self._regex_patterns.root_state)
+        finally:
+            self._depth -= 1
+
+    def _begin_call(self, filetree: mobase.IFileTree):
+        # only the plans of a single root tree are kept, plans of its trees are
+        # still checked before being reused (see `check_plan`)
+        if self._depth == 0 and self._plans_root is not filetree:
+            self._plans.clear()
+            self._plans_root = filetree
+        self._depth += 1
+
+    def _check(
+        self, filetree: mobase.IFileTree, state: PatternState
+    ) -> mobase.ModDataChecker.CheckReturn:
+        plan = self.check_plan(filetree, state)
+        if plan.status is not None:
+            return plan.status
 
-        rp = self._regex_patterns
-        for entry in filetree:
-            name = entry.name().casefold()
-
-            if rp.ignore.match(name):
-                continue
-            if rp.unfold.match(name):
-                if is_directory(entry):
-                    status = self.dataLooksValid(entry)
-                else:
+        status = mobase.ModDataChecker.INVALID
+        for entry, entry_class in plan:
+            match entry_class:
+                case ("ignore", _):
+                    continue
+                case ("unfold", _):
+                    if is_directory(entry):
+                        status = self.dataLooksValid(entry)
+                    else:
+                        status = mobase.ModDataChecker.INVALID
+                        break
+                case ("valid", _):
+                    if status is mobase.ModDataChecker.INVALID:
+                        status = mobase.ModDataChecker.VALID
+                case ("descend", _):
+                    assert is_directory(entry)
+                    substate = self._regex_patterns.descend(
+                        state, entry.name().casefold()
+                    )
+                    if self._check(entry, substate) is mobase.ModDataChecker.FIXABLE:
+                        status = mobase.ModDataChecker.FIXABLE
+                    elif status is mobase.ModDataChecker.INVALID:
+                        status = mobase.ModDataChecker.VALID
+                case ("delete" | "move", _):
+                    status = mobase.ModDataChecker.FIXABLE
+                case _:
                     status = mobase.ModDataChecker.INVALID
                     break
-            elif rp.valid.match(name):
-                if status is mobase.ModDataChecker.INVALID:
-                    status = mobase.ModDataChecker.VALID
-            elif rp.delete.match(name) or rp.move_match(name) is not None:
-                status = mobase.ModDataChecker.FIXABLE
-            else:
-                status = mobase.ModDataChecker.INVALID
-                break
+
+        plan.status = status
         return status
 
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
-        rp = self._regex_patterns
-        for entry in list(filetree):
-            name = entry.name()
-
-            if rp.ignore.match(name):
-                continue
-            # unfold first - if this match, entry is a directory (checked in
-            # dataLooksValid)
-            if rp.unfold.match(name):
-                assert is_directory(entry)
-                filetree.merge(entry)
-                entry.detach()
-
-            elif rp.valid.match(name):
-                continue
-
-            elif rp.delete.match(name):
-                entry.detach()
-
-            elif (move_key := rp.move_match(name)) is not None:
-                target = self._file_patterns.move[move_key]
-                filetree.move(entry, target)
-
+        self._begin_call(filetree)
+        try:
+            self._fix(filetree, self._regex_patterns.root_state, filetree)
+        finally:
+            self._depth -= 1
         return filetree
+
+    def _fix(
+        self, filetree: mobase.IFileTree, state: PatternState, root: mobase.IFileTree
+    ):
+        plan = self.check_plan(filetree, state)
+        # the tree is modified, so the plan is no longer valid
+        del self._plans[id(filetree)]
+        for entry, entry_class in plan:
+            match entry_class:
+                case ("unfold", _):
+                    # if this match, entry is a directory (checked in dataLooksValid)
+                    assert is_directory(entry)
+                    filetree.merge(entry)
+                    entry.detach()
+                case ("descend", _):
+                    assert is_directory(entry)
+                    substate = self._regex_patterns.descend(
+                        state, entry.name().casefold()
+                    )
+                    self._fix(entry, substate, root)
+                case ("delete", _):
+                    entry.detach()
+                case ("move", str(target)):
+                    # targets are relative to the root of the mod
+                    root.move(entry, target)
+                case _:
+                    # ignored, valid or unknown
+                    continue
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, Sequence, cast
+
+import mobase
+
+from .basic_mod_data_checker import OptionalRegexPattern
+from .utils import is_directory
+
+ContentDefinition = tuple[int, str, str] | tuple[int, str, str, bool]
+"""`(id, name, icon)` or `(id, name, icon, filter_only)`, see
+`mobase.ModDataContent.Content`."""
+
+
+@dataclass(frozen=True)
+class ContentRule:
+    """
+    Rule of a `BasicModDataContent`, mods with an entry matching the rule have the
+    given content.
+
+    Args:
+        content: ID of the content.
+        path (optional): Folder containing the entries, relative to the root of the
+            mod. Segments can be glob patterns, e.g. `"Data"` or `"*/Public"`.
+            Defaults to the root.
+        recursive (optional): Also match the entries in the subfolders of `path`.
+        extensions (optional): Suffixes of the matching files, without the dot.
+        files (optional): Glob patterns of the matching file names.
+        directories (optional): Glob patterns of the matching directory names.
+    """
+
+    content: int
+    path: str = ""
+    recursive: bool = False
+    extensions: list[str] | None = None
+    files: list[str] | None = None
+    directories: list[str] | None = None
+
+
+class ContentNode:
+    """
+    Node of the folder trie of the content rules, with the rules matching the entries
+    of the folders at this depth and the branches towards the deeper ones.
+    """
+
+    def __init__(self, recursive: bool = False) -> None:
+        self.recursive = recursive
+        """Whether the rules of this node also apply to the subfolders."""
+
+        self.extensions: dict[str, set[int]] = {}
+        self.files: list[tuple[re.Pattern[str], int]] = []
+        self.directories: list[tuple[re.Pattern[str], int]] = []
+        self.branches: list[tuple[re.Pattern[str], ContentNode]] = []
+        self.deep: ContentNode | None = None
+        """Recursive rules starting at this depth."""
+
+        self._children: dict[str, ContentNode] = {}
+
+    def add(self, segments: list[str], rule: ContentRule):
+        if segments:
+            segment = segments[0].casefold()
+            child = self._children.get(segment)
+            if child is None:
+                child = self._children[segment] = ContentNode()
+                self.branches.append(
+                    (re.compile(fnmatch.translate(segment), re.I), child)
+                )
+            child.add(segments[1:], rule)
+            return
+
+        node = self
+        if rule.recursive:
+            if self.deep is None:
+                self.deep = ContentNode(recursive=True)
+            node = self.deep
+
+        for extension in rule.extensions or ():
+            node.extensions.setdefault(extension.casefold(), set()).add(rule.content)
+        if rule.files:
+            node.files.append(
+                (OptionalRegexPattern.regex_from_glob_list(rule.files), rule.content)
+            )
+        if rule.directories:
+            node.directories.append(
+                (
+                    OptionalRegexPattern.regex_from_glob_list(rule.directories),
+                    rule.content,
+                )
+            )
+
+    def expand(self) -> ContentState:
+        return (self,) if self.deep is None else (self, self.deep)
+
+
+ContentState = tuple[ContentNode, ...]
+"""Nodes of the rule trie active for the entries of a tree."""
+
+
+class BasicModDataContent(mobase.ModDataContent):
+    """Game feature that is used to list the contents of mods via simple rules.
+
+    The rules are compiled into a trie of folders, with lookup tables of the file
+    extensions. The contents of a mod are found with a single walk of its tree, that
+    only goes into the folders some rules apply to and stops as soon as every content
+    of the rules is found.
+
+    Args:
+        contents: The contents, see `ContentDefinition`.
+        rules: The rules, see `ContentRule`. A content can have several rules.
+
+    Example:
+
+        BasicModDataContent(
+            [(Content.PLUGIN, "Plugins", ":/MO/gui/content/plugin")],
+            [ContentRule(Content.PLUGIN, "Data", extensions=["esm", "esp"])],
+        )
+    """
+
+    _contents: list[ContentDefinition]
+
+    _root: ContentNode
+    """Root of the rule trie."""
+
+    _rule_contents: frozenset[int]
+    """Contents of the rules, the walk stops once all of them are found."""
+
+    def __init__(
+        self,
+        contents: Iterable[ContentDefinition],
+        rules: Sequence[ContentRule],
+    ):
+        super().__init__()
+
+        self._contents = list(contents)
+        self._root = ContentNode()
+        for rule in rules:
+            segments = [segment for segment in re.split(r"[/\\]", rule.path) if segment]
+            self._root.add(segments, rule)
+        self._rule_contents = frozenset(rule.content for rule in rules)
+
+    def getAllContents(self) -> list[mobase.ModDataContent.Content]:
+        return [
+            mobase.ModDataContent.Content(id, name, icon, *filter_only)
+            for id, name, icon, *filter_only in self._contents
+        ]
+
+    def getContentsFor(self, filetree: mobase.IFileTree) -> list[int]:
+        contents: set[int] = set()
+        self._walk(filetree, self._root.expand(), contents)
+        return list(contents)
+
+    def _descend(self, state: ContentState, name: str) -> ContentState:
+        substate: list[ContentNode] = []
+        for node in state:
+            if node.recursive:
+                substate.append(node)
+            for pattern, child in node.branches:
+                if pattern.match(name):
+                    substate.extend(child.expand())
+        return tuple(substate)
+
+    def _walk(
+        self, filetree: mobase.IFileTree, state: ContentState, contents: set[int]
+    ) -> bool:
+        """
+        Add the contents of the given tree, returns True once every content of the
+        rules is found.
+        """
+        for entry in filetree:
+            name = entry.name()
+            if is_directory(entry):
+                for node in state:
+                    for pattern, content in node.directories:
+                        if content not in contents and pattern.match(name):
+                            contents.add(content)
+                if len(contents) == len(self._rule_contents):
+                    return True
+                substate = self._descend(state, name)
+                if substate and self._walk(entry, substate, contents):
+                    return True
+            else:
+                suffix = entry.suffix().casefold()
+                for node in state:
+                    if suffix in node.extensions:
+                        contents.update(node.extensions[suffix])
+                    for pattern, content in node.files:
+                        if content not in contents and pattern.match(name):
+                            contents.add(content)
+                if len(contents) == len(self._rule_contents):
+                    return True
+        return False
+
+
+def mod_stamp(path: str) -> tuple[int, int]:
+    """
+    Compute the modification stamp of a mod directory: the mtimes of its meta.ini
+    (written by MO2 when the mod is installed or edited) and of the directory itself
+    (updated when a top-level entry is added, removed or renamed).
+
+    Only the mod directory is looked at, so changes deeper in the mod made outside of
+    MO2 are not seen until the next refresh, see `ModDataContentCache`.
+
+    Raises:
+        OSError: if the mod directory cannot be read.
+    """
+    try:
+        meta_mtime = os.stat(os.path.join(path, "meta.ini")).st_mtime_ns
+    except FileNotFoundError:
+        meta_mtime = -1
+    return (meta_mtime, os.stat(path).st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class _ModContents:
+    path: str
+    stamp: tuple[int, int]
+    names: tuple[str, ...]
+    contents: tuple[int, ...]
+
+
+class ModDataContentCache(mobase.ModDataContent):
+    """
+    Wrapper of a `mobase.ModDataContent` that keeps the contents of each mod until
+    the next refresh of MO2 (e.g. F5), instead of computing them each time they are
+    requested.
+
+    Contents are also computed again when the mod is installed again, or when its
+    meta.ini or top-level entries change (see `mod_stamp`). Other changes made
+    outside of MO2 are only seen after a refresh.
+
+    Mods are found from the name of the root of their tree, which is the name of
+    the mod directory. Other trees (e.g. archives, unnamed trees) and mods not
+    managed by MO2 are not cached.
+
+    Example:
+
+        self._register_feature(ModDataContentCache(MyModDataContent(), organizer))
+    """
+
+    _mods: dict[str, _ModContents]
+    """Contents of the mods, by mod name."""
+
+    def __init__(self, content: mobase.ModDataContent, organizer: mobase.IOrganizer):
+        super().__init__()
+        self._content = content
+        self._organizer = organizer
+        self._mods = {}
+        organizer.modList().onModInstalled(lambda mod: self._forget(mod.name()))
+        organizer.modList().onModRemoved(self._forget)
+        organizer.onNextRefresh(self._on_refresh, False)
+
+    def _on_refresh(self):
+        # refresh callbacks are only called once, so register again for the next one
+        self.clear()
+        self._organizer.onNextRefresh(self._on_refresh, False)
+
+    def _forget(self, name: str):
+        self._mods.pop(name, None)
+
+    def clear(self):
+        self._mods.clear()
+
+    def getAllContents(self) -> list[mobase.ModDataContent.Content]:
+        return self._content.getAllContents()
+
+    def getContentsFor(self, filetree: mobase.IFileTree) -> list[int]:
+        name = filetree.name()
+        if not name:
+            return self._content.getContentsFor(filetree)
+        # None for names that are not mods, e.g. archives:
+        mod = cast(mobase.IModInterface | None, self._organizer.modList().getMod(name))
+        if mod is None or mod.name() != name or mod.isForeign() or mod.isSeparator():
+            return self._content.getContentsFor(filetree)
+
+        path = mod.absolutePath()
+        try:
+            stamp = mod_stamp(path)
+        except OSError:
+            return self._content.getContentsFor(filetree)
+        names = tuple(entry.name() for entry in filetree)
+
+        cached = self._mods.get(name)
+        if (
+            cached is not None
+            and cached.path == path
+            and cached.stamp == stamp
+            and cached.names == names
+        ):
+            return list(cached.contents)
+
+        contents = self._content.getContentsFor(filetree)
+        self._mods[name] = _ModContents(path, stamp, names, tuple(contents))
+        return contents
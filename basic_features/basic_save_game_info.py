@@ -6,8 +6,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Self, Sequence
 
-from PyQt6.QtCore import QDateTime, QLocale, Qt
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import (
+    QDateTime,
+    QLocale,
+    QObject,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
 from PyQt6.QtWidgets import QFormLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
 import mobase
@@ -55,17 +65,143 @@ def get_filedate_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     return {"File Date:": format_date(save.getCreationTime())}
 
 
+DeferredMetadata = Callable[[], Mapping[str, Any] | None]
+"""Metadata callable run in a worker thread, see `BasicGameSaveGameInfoWidget`."""
+
+DeferredPreview = Callable[[], QImage | Path | str | None]
+"""Preview callable run in a worker thread, see `BasicGameSaveGameInfoWidget`."""
+
+
+class _SaveInfoLoaderSignals(QObject):
+    metadata_loaded = pyqtSignal(int, object)
+    """`(request_id, rows)`, rows being None if the metadata could not be read."""
+
+    preview_loaded = pyqtSignal(int, object)
+    """`(request_id, image)`, image being None if there is no preview."""
+
+
+class _SaveInfoLoader:
+    """Loads the deferred metadata and the preview of a save, `run` is meant to be
+    executed in a worker thread.
+
+    Deferred callables of the games are called, then the preview is read with
+    `QImageReader` directly at the target width, or an already loaded `QImage` is
+    scaled, all being safe outside of the GUI thread. Results are sent back to the
+    GUI thread through `signals`, as plain data and `QImage`.
+    """
+
+    def __init__(
+        self,
+        request_id: int,
+        metadata: DeferredMetadata | None,
+        preview: QImage | Path | DeferredPreview | None,
+        max_width: int,
+        signals: _SaveInfoLoaderSignals,
+    ):
+        self._request_id = request_id
+        self._metadata = metadata
+        self._preview = preview
+        self._max_width = max_width
+        self._signals = signals
+        self._cancelled = False
+
+    def cancel(self):
+        """Drop the results of this request, requests that have not been started
+        yet return immediately."""
+        self._cancelled = True
+
+    def run(self):
+        if self._metadata is not None and not self._cancelled:
+            rows: list[tuple[str, str]] | None = None
+            try:
+                metadata = self._metadata() or {}
+                rows = [(key, str(value)) for key, value in metadata.items()]
+            except Exception as e:
+                print(f"Failed to retrieve save game metadata: {e}", file=sys.stderr)
+            self._emit(self._signals.metadata_loaded, rows)
+
+        if self._preview is not None and not self._cancelled:
+            image: QImage | None = None
+            try:
+                image = self._read_preview(self._preview)
+            except Exception as e:
+                print(f"Failed to read the save game preview: {e}", file=sys.stderr)
+            self._emit(self._signals.preview_loaded, image)
+
+    def _emit(self, signal: Any, value: object):
+        if self._cancelled:
+            return
+        try:
+            signal.emit(self._request_id, value)
+        except RuntimeError:
+            pass  # widget (and signals) deleted while loading
+
+    def _read_preview(
+        self, preview: QImage | Path | DeferredPreview | None
+    ) -> QImage | None:
+        loaded = preview() if callable(preview) else preview
+        if isinstance(loaded, str):
+            loaded = Path(loaded)
+        if loaded is None:
+            return None
+        if isinstance(loaded, QImage):
+            image = loaded
+        elif not loaded.exists():
+            print(
+                f"Failed to retrieve the preview, file not found: {loaded}",
+                file=sys.stderr,
+            )
+            return None
+        else:
+            reader = QImageReader(str(loaded))
+            size = reader.size()
+            if size.isValid() and size.width() > 0:
+                reader.setScaledSize(
+                    QSize(
+                        self._max_width,
+                        round(size.height() * self._max_width / size.width()),
+                    )
+                )
+            image = reader.read()
+            if image.isNull():
+                print(
+                    f"Failed to read the save game preview {loaded}: "
+                    f"{reader.errorString()}",
+                    file=sys.stderr,
+                )
+                return None
+        if image.isNull() or image.width() == self._max_width:
+            return image
+        return image.scaledToWidth(
+            self._max_width, Qt.TransformationMode.SmoothTransformation
+        )
+
+
 class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
-    """Save game info widget to display metadata and a preview."""
+    """Save game info widget to display metadata and a preview.
+
+    The preview and metadata callbacks are called in the GUI thread, as they may use
+    the `ISaveGame` or `QPixmap`. Callbacks that read files should instead return a
+    callable (`DeferredPreview` or `DeferredMetadata`, without Qt GUI objects or
+    state shared with the GUI thread), which is run in a worker thread, along with
+    the decoding of the preview (from a file or a `QImage`).
+    """
+
+    LOADING_DELAY_MS = 200
+    """Delay before showing a placeholder while the preview is loaded."""
 
     def __init__(
         self,
         parent: QWidget | None,
         get_preview: (
-            Callable[[Path], QPixmap | QImage | Path | str | None] | None
+            Callable[[Path], QPixmap | QImage | Path | str | DeferredPreview | None]
+            | None
         ) = lambda p: None,
         get_metadata: (
-            Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None] | None
+            Callable[
+                [Path, mobase.ISaveGame], Mapping[str, Any] | DeferredMetadata | None
+            ]
+            | None
         ) = get_filedate_metadata,
         max_width: int = 320,
     ):
@@ -73,9 +209,12 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         Args:
             parent: parent widget
             get_preview (optional): `callback(savegame_path)` returning the
-                saves preview image or the path to it.
+                saves preview image or the path to it, or a callable returning
+                them, run in a worker thread.
             get_metadata (optional): `callback(savegame_path, ISaveGame)` returning
-                the saves metadata. By default the saves file date is shown.
+                the saves metadata, or a callable returning it, run in a worker
+                thread. By default, or if the callback fails, the saves file date
+                is shown.
             max_width (optional): The maximum widget and (scaled) preview width.
                 Defaults to 320.
         """
@@ -88,6 +227,24 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         self._get_metadata = get_metadata or get_filedate_metadata
         self._max_width = max_width or 320
 
+        # Single worker, so that a newer request only waits for the running one,
+        # stale requests are cancelled in `setSave`.
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._loader: _SaveInfoLoader | None = None
+        self._request_id = 0
+        self._save: tuple[Path, mobase.ISaveGame] | None = None
+        self._preview_pending = False
+        self._loader_signals = _SaveInfoLoaderSignals(self)
+        self._loader_signals.metadata_loaded.connect(self._on_metadata_loaded)
+        self._loader_signals.preview_loaded.connect(self._on_preview_loaded)
+
+        # Placeholder, only shown if the preview takes a while to load
+        self._loading_timer = QTimer(self)
+        self._loading_timer.setSingleShot(True)
+        self._loading_timer.setInterval(self.LOADING_DELAY_MS)
+        self._loading_timer.timeout.connect(self._show_loading)
+
         layout = QVBoxLayout()
 
         # Metadata form
@@ -96,6 +253,8 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         self._metadata_layout = form_layout = QFormLayout(self._metadata_widget)
         form_layout.setContentsMargins(0, 0, 0, 0)
         form_layout.setVerticalSpacing(2)
+        # Rows are reused between saves, see `_set_metadata`.
+        self._metadata_rows: list[tuple[QLabel, QLabel]] = []
         layout.addWidget(self._metadata_widget)
         self._metadata_widget.hide()  # Backwards compatibility (no metadata)
 
@@ -111,57 +270,149 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
     def setSave(self, save: mobase.ISaveGame):
         save_path = Path(save.getFilepath())
 
+        # Cancel the previous request, if any
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        self._loading_timer.stop()
+        self._request_id += 1
+        self._save = (save_path, save)
+        self._preview_pending = False
+
         # Clear previous
         self.hide()
         self._label.clear()
-        while self._metadata_layout.count():
-            layoutItem = self._metadata_layout.takeAt(0)
-            if layoutItem is not None and (w := layoutItem.widget()):
-                w.deleteLater()
-
-        # Retrieve the pixmap and metadata:
-        preview = self._get_preview(save_path)
-        pixmap = None
-
-        # Set the preview pixmap if the preview file exits
-        if preview is not None:
-            if isinstance(preview, str):
-                preview = Path(preview)
-            if isinstance(preview, Path):
-                if preview.exists():
-                    pixmap = QPixmap(str(preview))
-                else:
-                    print(
-                        f"Failed to retrieve the preview, file not found: {preview}",
-                        file=sys.stderr,
-                    )
-            elif isinstance(preview, QImage):
-                pixmap = QPixmap.fromImage(preview)
-            else:
-                pixmap = preview
-        if pixmap and not pixmap.isNull():
-            # Scale the pixmap and show it:
-            pixmap = pixmap.scaledToWidth(self._max_width)
-            self._label.setPixmap(pixmap)
-            self._label.show()
+        self._label.hide()
+
+        # Add metadata, file date by default, deferred metadata is read in the worker.
+        metadata = self._read_metadata(save_path, save)
+        deferred_metadata = None
+        if callable(metadata):
+            deferred_metadata = metadata
+            self._metadata_widget.hide()
         else:
-            self._label.hide()
-            pixmap = None
+            self._show_metadata(metadata)
+
+        # Retrieve the preview, files and images are read in the worker:
+        preview = self._read_preview(save_path)
+        if isinstance(preview, QPixmap):
+            self._set_preview(preview.scaledToWidth(self._max_width))
+            preview = None
+
+        if deferred_metadata is not None or preview is not None:
+            self._preview_pending = preview is not None
+            self._loader = _SaveInfoLoader(
+                self._request_id,
+                deferred_metadata,
+                preview,
+                self._max_width,
+                self._loader_signals,
+            )
+            self._thread_pool.start(QRunnable.create(self._loader.run))
+            if self._preview_pending:
+                self._loading_timer.start()
+
+        self._update_visibility()
+
+    def _read_metadata(
+        self, save_path: Path, save: mobase.ISaveGame
+    ) -> list[tuple[str, str]] | DeferredMetadata:
+        try:
+            metadata = self._get_metadata(save_path, save) or {}
+            if callable(metadata):
+                return metadata
+        except Exception as e:
+            print(f"Failed to retrieve save game metadata: {e}", file=sys.stderr)
+            return self._filedate_metadata(save_path, save)
+        return [(key, str(value)) for key, value in metadata.items()]
+
+    @staticmethod
+    def _filedate_metadata(
+        save_path: Path, save: mobase.ISaveGame
+    ) -> list[tuple[str, str]]:
+        try:
+            metadata = get_filedate_metadata(save_path, save)
+        except OSError:
+            return []
+        return [(key, str(value)) for key, value in metadata.items()]
+
+    def _read_preview(
+        self, save_path: Path
+    ) -> QPixmap | QImage | Path | DeferredPreview | None:
+        try:
+            preview = self._get_preview(save_path)
+        except Exception as e:
+            print(f"Failed to retrieve save game preview: {e}", file=sys.stderr)
+            return None
+        if isinstance(preview, str):
+            preview = Path(preview)
+        return preview
 
-        # Add metadata, file date by default.
-        metadata = self._get_metadata(save_path, save)
+    def _show_metadata(self, metadata: list[tuple[str, str]]):
         if metadata:
-            for key, value in metadata.items():
-                self._metadata_layout.addRow(*self._new_form_row(key, str(value)))
+            self._set_metadata(metadata)
             self._metadata_widget.show()
-            self._metadata_widget.setLayout(self._metadata_layout)
             self._metadata_widget.adjustSize()
         else:
             self._metadata_widget.hide()
 
-        if metadata or pixmap:
+    def _on_metadata_loaded(self, request_id: int, rows: list[tuple[str, str]] | None):
+        if request_id != self._request_id or self._save is None:
+            return
+        if rows is None:
+            rows = self._filedate_metadata(*self._save)
+        self._show_metadata(rows)
+        self._update_visibility()
+
+    def _show_loading(self):
+        if not self._preview_pending:
+            return
+        self._label.setText("Loading...")
+        self._label.show()
+        self._update_visibility()
+
+    def _on_preview_loaded(self, request_id: int, image: QImage | None):
+        if request_id != self._request_id:
+            return
+        self._loader = None
+        self._preview_pending = False
+        self._loading_timer.stop()
+
+        self._label.clear()
+        self._label.hide()
+        if image is not None and not image.isNull():
+            self._set_preview(QPixmap.fromImage(image))
+        self._update_visibility()
+
+    def _set_preview(self, pixmap: QPixmap):
+        if not pixmap.isNull():
+            # Show the scaled pixmap:
+            self._label.setPixmap(pixmap)
+            self._label.show()
+
+    def _update_visibility(self):
+        if self._metadata_widget.isVisibleTo(self) or self._label.isVisibleTo(self):
             self.adjustSize()
             self.show()
+        else:
+            self.hide()
+
+    def _set_metadata(self, metadata: list[tuple[str, str]]):
+        """Update the form rows in place, new rows are only created when the save
+        has more metadata than any previous one, extra rows are hidden."""
+        layout = self._metadata_layout
+        for row, (key, value) in enumerate(metadata):
+            if row < len(self._metadata_rows):
+                qLabel, qField = self._metadata_rows[row]
+                qLabel.setText(key)
+                qField.setText(value)
+                layout.setRowVisible(row, True)
+            else:
+                qLabel, qField = self._new_form_row(key, value)
+                self._metadata_rows.append((qLabel, qField))
+                layout.addRow(qLabel, qField)
+        for row in range(len(metadata), len(self._metadata_rows)):
+            layout.setRowVisible(row, False)
 
     def _new_form_row(self, label: str = "", field: str = ""):
         qLabel = QLabel(text=label)
@@ -186,10 +437,14 @@ class BasicGameSaveGameInfo(mobase.SaveGameInfo):
     def __init__(
         self,
         get_preview: (
-            Callable[[Path], QPixmap | QImage | Path | str | None] | None
+            Callable[[Path], QPixmap | QImage | Path | str | DeferredPreview | None]
+            | None
         ) = None,
         get_metadata: (
-            Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None] | None
+            Callable[
+                [Path, mobase.ISaveGame], Mapping[str, Any] | DeferredMetadata | None
+            ]
+            | None
         ) = None,
         max_width: int = 0,
     ):
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Iterable, Sequence, TextIO, cast
+
+JsonPath = tuple[str | int, ...]
+
+_NON_WHITESPACE = re.compile(r"\S")
+# string, not decoded
+_STRING = r'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_OTHER = r'[^"{}\[\]]*+'
+# content of a container up to its next bracket, strings included, a string cut at
+# the end of the buffer stops the match at its opening quote
+_CONTENT = re.compile(f"{_OTHER}(?:{_STRING}{_OTHER})*+", re.S)
+# container without nested containers
+_FLAT = re.compile(f"[{{\\[]{_CONTENT.pattern}[}}\\]]", re.S)
+_SCALAR_END = re.compile(r"[\s,\]}]")
+
+# not part of the typeshed stubs
+_scanstring: Callable[[str, int], tuple[str, int]] = json.decoder.scanstring  # type: ignore
+
+
+class _JsonPathScanner:
+    """Incremental JSON reader that only decodes the values at the requested paths
+    and skips everything else, stopping as soon as all paths are found."""
+
+    def __init__(self, fp: TextIO, paths: Iterable[JsonPath], chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos: int = 0
+        self._eof = False
+
+        self._paths = set(paths)
+        self._prefixes = {path[:i] for path in self._paths for i in range(len(path))}
+        self._decoder = json.JSONDecoder()
+        self.values: dict[JsonPath, Any] = {}
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping the consumed part of the buffer. Returns
+        False at the end of the file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _peek(self) -> str:
+        """Skip whitespaces and return the next character, or "" at the end."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return match.group()
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _string(self) -> str:
+        self._expect('"')
+        while True:
+            try:
+                value, self._pos = _scanstring(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            # a number or a literal can be cut at the end of the buffer
+            if _SCALAR_END.search(self._buffer, self._pos) is not None or self._eof:
+                try:
+                    value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                    self._pos = end
+                    return value
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise
+            self._fill()
+
+    def _skip(self):
+        char = self._peek()
+        if char == '"':
+            self._string()
+        elif char in "{[":
+            depth = 0
+            while True:
+                match = _CONTENT.match(self._buffer, self._pos)
+                if match is not None:
+                    self._pos = match.end()
+                char = self._buffer[self._pos : self._pos + 1]
+                if char in ('"', ""):
+                    # cut string or end of the buffer
+                    if not self._fill():
+                        raise self._error("Unterminated value")
+                    continue
+                if char in "{[" and (flat := _FLAT.match(self._buffer, self._pos)):
+                    self._pos = flat.end()
+                else:
+                    self._pos += 1
+                    depth += 1 if char in "{[" else -1
+                if depth == 0:
+                    return
+        else:
+            self._decode()
+
+    def _extract(self, path: JsonPath, value: Any):
+        """Retrieve the requested paths below `path` from its decoded value."""
+        for target in self._paths:
+            if len(target) <= len(path) or target[: len(path)] != path:
+                continue
+            current: Any = value
+            for key in target[len(path) :]:
+                if not isinstance(current, (dict, list)):
+                    break
+                try:
+                    current = cast(Any, current)[key]
+                except (KeyError, IndexError, TypeError):
+                    break
+            else:
+                self.values.setdefault(target, current)
+
+    def _done(self) -> bool:
+        return len(self.values) == len(self._paths)
+
+    def scan(self, path: JsonPath = ()):
+        if path in self._paths and path not in self.values:
+            value = self.values[path] = self._decode()
+            if path in self._prefixes:
+                self._extract(path, value)
+            return
+        if path not in self._prefixes:
+            self._skip()
+            return
+
+        char = self._peek()
+        if char == "{":
+            self._pos += 1
+            if self._peek() == "}":
+                self._pos += 1
+                return
+            while True:
+                key = self._string()
+                self._expect(":")
+                self.scan(path + (key,))
+                if self._done():
+                    return
+                char = self._peek()
+                self._pos += 1
+                if char == "}":
+                    return
+                if char != ",":
+                    raise self._error("Expecting ',' delimiter")
+        elif char == "[":
+            self._pos += 1
+            if self._peek() == "]":
+                self._pos += 1
+                return
+            index = 0
+            while True:
+                self.scan(path + (index,))
+                if self._done():
+                    return
+                char = self._peek()
+                self._pos += 1
+                if char == "]":
+                    return
+                if char != ",":
+                    raise self._error("Expecting ',' delimiter")
+                index += 1
+        else:
+            self._skip()
+
+
+def find_json_values(
+    fp: TextIO, paths: Iterable[Sequence[str | int]], chunk_size: int = 1 << 16
+) -> dict[JsonPath, Any]:
+    """Retrieve the values at the given paths of a JSON document without loading
+    the whole document.
+
+    The file is read by chunks and parsing stops as soon as all the paths have been
+    found. Values that are not on the way to one of the paths are skipped without
+    being decoded.
+
+    Args:
+        fp: The JSON file.
+        paths: Paths of the values to retrieve, e.g. `("data", "estatename")`,
+            integers are array indices.
+        chunk_size (optional): Size of the chunks read from the file.
+
+    Returns:
+        The values found, by path (as tuple). Missing paths are not included.
+
+    Raises:
+        json.JSONDecodeError: if the document is invalid before all the paths are
+            found.
+    """
+    scanner = _JsonPathScanner(fp, (tuple(path) for path in paths), chunk_size)
+    scanner.scan()
+    return scanner.values
@@ -0,0 +1,10 @@
+"""
+Benchmarks of the basic games features, runnable without Mod Organizer 2.
+
+The benchmarks are run from the root of the repository, e.g.:
+
+    python -m benchmarks.mod_data_checkers --output checkers.json
+
+They use an in-memory stand-in of the parts of `mobase` used by the plugins (see
+`benchmarks.mobase_standin`), so they must not be run from inside MO2.
+"""
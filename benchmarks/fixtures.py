@@ -0,0 +1,137 @@
+"""
+Generators of archive-shaped trees, as lists of paths (see `make_tree`).
+
+Every generator is deterministic, so reports of different runs can be compared.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+# Extensions found in mod archives, weighted towards assets:
+_ASSET_EXTENSIONS = ["dds", "png", "nif", "wav", "ogg", "xml", "json", "txt", "ini"]
+_CODE_EXTENSIONS = ["dll", "lua", "py", "ts4script", "asi", "cs", "script"]
+_DATA_EXTENSIONS = ["pak", "esp", "esm", "package", "archive", "bsa", "db0", "ltx"]
+
+_FOLDERS = [
+    "Data",
+    "Mods",
+    "textures",
+    "meshes",
+    "sounds",
+    "scripts",
+    "Content",
+    "Paks",
+    "gamedata",
+    "BepInEx",
+    "plugins",
+    "config",
+    "archive",
+    "pc",
+    "mod",
+    "r6",
+    "bin",
+    "x64",
+    "ui",
+    "Localization",
+]
+
+
+def _name(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(['item', 'asset', 'Part', 'NPC', 'map'])}_{index:05}"
+
+
+def _extension(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.7:
+        return rng.choice(_ASSET_EXTENSIONS)
+    if roll < 0.85:
+        return rng.choice(_CODE_EXTENSIONS)
+    return rng.choice(_DATA_EXTENSIONS)
+
+
+def small() -> list[str]:
+    """Small mod: a wrapper folder, a readme and a handful of files."""
+    return [
+        "My Mod v1.2/readme.txt",
+        "My Mod v1.2/Data/MyMod.esp",
+        "My Mod v1.2/Data/textures/mymod/armor.dds",
+        "My Mod v1.2/Data/textures/mymod/armor_n.dds",
+        "My Mod v1.2/Data/meshes/mymod/armor.nif",
+        "My Mod v1.2/Mods/MyMod.pak",
+        "My Mod v1.2/BepInEx/plugins/MyMod.dll",
+        "My Mod v1.2/MyMod.package",
+        "My Mod v1.2/fomod/info.xml",
+    ]
+
+
+def _random_tree(
+    seed: int, files: int, max_depth: int, wrapper: str | None
+) -> list[str]:
+    rng = random.Random(seed)
+    prefix = f"{wrapper}/" if wrapper else ""
+    directories = [prefix]
+    paths: list[str] = []
+    for index in range(files):
+        parent = rng.choice(directories)
+        depth = parent.count("/")
+        if depth < max_depth and rng.random() < 0.15:
+            parent = f"{parent}{rng.choice(_FOLDERS)}/"
+            directories.append(parent)
+        paths.append(f"{parent}{_name(rng, index)}.{_extension(rng)}")
+    return paths
+
+
+def typical() -> list[str]:
+    """Typical mod: a wrapper folder with ~2000 files, a few folders deep."""
+    return _random_tree(seed=1, files=2_000, max_depth=6, wrapper="Some Mod-123-1-0")
+
+
+def wide() -> list[str]:
+    """Pathological mod: 50k files without a wrapper folder, e.g. a modpack."""
+    return _random_tree(seed=2, files=50_000, max_depth=8, wrapper=None)
+
+
+def deep() -> list[str]:
+    """Pathological mod: a few files at each level of a chain of 256 folders."""
+    paths: list[str] = []
+    parent = "Deep Mod/"
+    for level in range(256):
+        parent = f"{parent}{_FOLDERS[level % len(_FOLDERS)]}_{level}/"
+        paths.extend(
+            f"{parent}file_{index}.{ext}"
+            for index, ext in enumerate(("txt", "dds", "json"))
+        )
+    return paths
+
+
+def flat_pak() -> list[str]:
+    """
+    Archive with `.pak` files and a readme in `Mods/`, for games taking `Mods/*.pak`,
+    e.g. Baldur's Gate 3 (the readme is deleted, `Mods/` is kept).
+    """
+    return ["Mods/MyMod.pak", "Mods/MyMod_Patch.pak", "Mods/readme.txt"]
+
+
+def loose_mods() -> list[str]:
+    """
+    Archive with loose files and a readme in `Mods/`, moved to `Data/Mods/` for
+    Baldur's Gate 3, unlike `flat_pak`.
+    """
+    return [
+        "Mods/MyMod/meta.lsx",
+        "Mods/MyMod/Story/RawFiles/Goals/MyMod.txt",
+        "Mods/readme.txt",
+    ]
+
+
+FIXTURES: dict[str, Callable[[], list[str]]] = {
+    "small": small,
+    "flat-pak": flat_pak,
+    "loose-mods": loose_mods,
+    "typical": typical,
+    "wide-50k": wide,
+    "deep-256": deep,
+}
+"""Fixtures, by name, from the smallest to the largest."""
@@ -0,0 +1,132 @@
+"""
+Benchmark of `find_json_values` against `json.loads` on large JSON saves, e.g. the
+`persist.game.json` of Darkest Dungeon campaigns, in time and peak memory.
+
+Usage:
+
+    python -m benchmarks.json_values [--saves DIR] [--output report.json]
+
+The `persist.game.json` files found in the given folder are used, synthetic
+campaigns otherwise, with the estate name at the start (as in real saves) or at the
+end of the document (worst case, the whole document is scanned).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from .utils import import_module, measure, peak_memory, write_report
+
+PATH = ("data", "estatename")
+
+# (number of heroes in the roster, whether the estate name is the last value):
+SYNTHETIC = [(100, False), (1_000, False), (5_000, False), (5_000, True)]
+
+
+def _hero(rng: random.Random, index: int) -> dict[str, Any]:
+    return {
+        "id": index,
+        "name": f"Hero {index}",
+        "heroClass": rng.choice(["crusader", "highwayman", "plague_doctor", "vestal"]),
+        "resolveXp": rng.randint(0, 10_000),
+        "stress": rng.randint(0, 200),
+        "quirks": {
+            f"quirk_{rng.randint(0, 99)}": {"isLocked": rng.random() < 0.1}
+            for _ in range(rng.randint(2, 8))
+        },
+        "skills": [rng.randint(0, 4) for _ in range(7)],
+        "trinkets": [
+            {"id": f"trinket_{rng.randint(0, 300)}", "rarity": "common"}
+            for _ in range(2)
+        ],
+        "history": [
+            {"dungeon": rng.choice(["ruins", "warrens", "weald", "cove"]), "week": w}
+            for w in range(rng.randint(0, 30))
+        ],
+    }
+
+
+def campaign(heroes: int, name_last: bool = False, seed: int = 1) -> str:
+    """Synthetic campaign, with the estate name at the start or at the end."""
+    rng = random.Random(seed)
+    data: dict[str, Any] = {}
+    if not name_last:
+        data["estatename"] = "Hamlet of the Ancestor"
+    data["roster"] = [_hero(rng, index) for index in range(heroes)]
+    data["town"] = {"districts": [rng.randint(0, 5) for _ in range(heroes // 10)]}
+    if name_last:
+        data["estatename"] = "Hamlet of the Ancestor"
+    return json.dumps({"__revision_dont_touch": 41, "data": data}, indent=1)
+
+
+def benchmark(name: str, path: Path, repeat: int) -> dict[str, Any]:
+    json_utils = import_module("basic_features.json_utils")
+
+    def stream() -> Any:
+        with path.open() as fp:
+            return json_utils.find_json_values(fp, [PATH]).get(PATH)
+
+    def load() -> Any:
+        value = json.loads(path.read_text())
+        for key in PATH:
+            value = value[key]
+        return value
+
+    if stream() != load():
+        raise RuntimeError(f"different values found in {path}")
+
+    def run(function: Callable[[], Any]) -> dict[str, Any]:
+        return {"time": measure(function, repeat), "peak_memory": peak_memory(function)}
+
+    find_json_values = run(stream)
+    json_loads = run(load)
+    return {
+        "save": name,
+        "size": path.stat().st_size,
+        "find_json_values": find_json_values,
+        "json.loads": json_loads,
+        "speedup": round(
+            json_loads["time"]["median"] / find_json_values["time"]["median"], 2
+        ),
+    }
+
+
+def _saves(folder: str | None, directory: Path) -> list[tuple[str, Path]]:
+    if folder is not None:
+        root = Path(folder)
+        return [
+            (path.relative_to(root).as_posix(), path)
+            for path in sorted(root.rglob("persist.game.json"))
+        ]
+    saves: list[tuple[str, Path]] = []
+    for heroes, name_last in SYNTHETIC:
+        name = f"campaign-{heroes}{'-name-last' if name_last else ''}.json"
+        (directory / name).write_text(campaign(heroes, name_last))
+        saves.append((name, directory / name))
+    return saves
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of find_json_values.")
+    parser.add_argument("--saves", help="folder of Darkest Dungeon saves")
+    parser.add_argument("--output", "-o", help="JSON report, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            benchmark(name, path, args.repeat)
+            for name, path in _saves(args.saves, Path(directory))
+        ]
+    write_report({"repeat": args.repeat, "results": results}, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,510 @@
+"""
+Stand-in for the `mobase` module, with a pure-Python in-memory file tree.
+
+Only the parts used by the mod data checkers and contents are implemented: the
+file tree (`FileTreeEntry` and `IFileTree`), `ModDataChecker` and `ModDataContent`.
+Other names (plugin interfaces, settings...) are permissive placeholders, so the
+game modules can be imported and initialized.
+"""
+
+from __future__ import annotations
+
+import enum
+import re
+import sys
+import types
+from typing import Any, Callable, Iterator
+
+from PyQt6.QtWidgets import QWidget
+
+
+class _StandInType(type):
+    def __new__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]):
+        # The interfaces of mobase do not forward their construction, which matters
+        # for plugins inheriting several of them:
+        if namespace.get("__module__") == __name__ and "__init__" not in namespace:
+            namespace["__init__"] = Placeholder.__init__
+        return super().__new__(cls, name, bases, namespace)
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Anything()
+
+
+class Placeholder(metaclass=_StandInType):
+    """
+    Base class of the placeholders, accepting any construction and class attribute,
+    e.g. for plugin interfaces. Instances only have the attributes of their class,
+    so `hasattr` keeps working for subclasses.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        pass
+
+
+class Anything(Placeholder):
+    """Placeholder that accepts any construction, call and attribute."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Anything()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return Anything()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(())
+
+    def __or__(self, other: Any) -> Any:
+        return self
+
+    __and__ = __or__
+    __ror__ = __or__
+    __rand__ = __or__
+
+
+class GameFeature(Placeholder):
+    pass
+
+
+class IPlugin(Placeholder):
+    pass
+
+
+class IPluginGame(IPlugin):
+    pass
+
+
+class IPluginFileMapper(IPlugin):
+    pass
+
+
+class IPluginTool(IPlugin):
+    pass
+
+
+class IPluginDiagnose(IPlugin):
+    pass
+
+
+class ISaveGame(Placeholder):
+    pass
+
+
+class ISaveGameInfoWidget(QWidget):
+    pass
+
+
+class SaveGameInfo(GameFeature):
+    pass
+
+
+class LocalSavegames(GameFeature):
+    pass
+
+
+class ScriptExtender(GameFeature):
+    pass
+
+
+class GamePlugins(GameFeature):
+    pass
+
+
+class ModState(enum.IntFlag):
+    EXISTS = 0x1
+    ACTIVE = 0x2
+    ESSENTIAL = 0x4
+    EMPTY = 0x8
+    ENDORSED = 0x10
+    VALID = 0x20
+    ALTERNATE = 0x40
+
+
+class ModDataChecker(GameFeature):
+    class CheckReturn(enum.IntEnum):
+        INVALID = 0
+        FIXABLE = 1
+        VALID = 2
+
+    INVALID = CheckReturn.INVALID
+    FIXABLE = CheckReturn.FIXABLE
+    VALID = CheckReturn.VALID
+
+    def dataLooksValid(self, filetree: IFileTree) -> ModDataChecker.CheckReturn:
+        raise NotImplementedError
+
+    def fix(self, filetree: IFileTree) -> IFileTree | None:
+        raise NotImplementedError
+
+
+class ModDataContent(GameFeature):
+    class Content:
+        def __init__(self, id: int, name: str, icon: str, filter_only: bool = False):
+            self._id = id
+            self._name = name
+            self._icon = icon
+            self._filter_only = filter_only
+
+        def id(self) -> int:
+            return self._id
+
+        def name(self) -> str:
+            return self._name
+
+    def getAllContents(self) -> list[ModDataContent.Content]:
+        raise NotImplementedError
+
+    def getContentsFor(self, filetree: IFileTree) -> list[int]:
+        raise NotImplementedError
+
+
+class FileTreeEntry:
+    """In-memory file tree entry, see `IFileTree`."""
+
+    FILE = 0x1
+    DIRECTORY = 0x2
+    FILE_OR_DIRECTORY = FILE | DIRECTORY
+
+    def __init__(self, parent: IFileTree | None, name: str):
+        self._parent = parent
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+    def suffix(self) -> str:
+        index = self._name.rfind(".")
+        return "" if index == -1 else self._name[index + 1 :]
+
+    def hasSuffix(self, suffixes: str | list[str]) -> bool:
+        if isinstance(suffixes, str):
+            suffixes = [suffixes]
+        return self.suffix().casefold() in (suffix.casefold() for suffix in suffixes)
+
+    def parent(self) -> IFileTree | None:
+        return self._parent
+
+    def isFile(self) -> bool:
+        return True
+
+    def isDir(self) -> bool:
+        return False
+
+    def fileType(self) -> int:
+        return FileTreeEntry.FILE
+
+    def path(self, sep: str = "\\") -> str:
+        names: list[str] = []
+        entry: FileTreeEntry = self
+        while entry._parent is not None:
+            names.append(entry._name)
+            entry = entry._parent
+        return sep.join(reversed(names))
+
+    def pathFrom(self, tree: IFileTree, sep: str = "\\") -> str:
+        names: list[str] = []
+        entry: FileTreeEntry | None = self
+        while entry is not None and entry is not tree:
+            names.append(entry._name)
+            entry = entry._parent
+        return sep.join(reversed(names)) if entry is tree else ""
+
+    def detach(self) -> bool:
+        if self._parent is None:
+            return False
+        self._parent._remove_child(self)  # pyright: ignore[reportPrivateUsage]
+        self._parent = None
+        return True
+
+    def moveTo(self, tree: IFileTree) -> bool:
+        return tree.insert(self, IFileTree.REPLACE)
+
+    def _clone(self, parent: IFileTree | None) -> FileTreeEntry:
+        return FileTreeEntry(parent, self._name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path('/')!r})"
+
+
+_SEPARATORS = re.compile(r"[/\\]+")
+
+
+def _split(path: str) -> list[str]:
+    return [part for part in _SEPARATORS.split(path) if part and part != "."]
+
+
+class IFileTree(FileTreeEntry):
+    """
+    In-memory file tree, following the `mobase.IFileTree` semantics: names are case
+    insensitive, entries are iterated directories first then by name, and `walk`
+    gives the path of the parent of each entry, with a trailing separator.
+    """
+
+    class InsertPolicy(enum.IntEnum):
+        FAIL_IF_EXISTS = 0
+        REPLACE = 1
+        MERGE = 2
+
+    class WalkReturn(enum.IntEnum):
+        CONTINUE = 0
+        STOP = 1
+        SKIP = 2
+
+    FAIL_IF_EXISTS = InsertPolicy.FAIL_IF_EXISTS
+    REPLACE = InsertPolicy.REPLACE
+    MERGE = InsertPolicy.MERGE
+
+    CONTINUE = WalkReturn.CONTINUE
+    STOP = WalkReturn.STOP
+    SKIP = WalkReturn.SKIP
+
+    def __init__(self, parent: IFileTree | None = None, name: str = ""):
+        super().__init__(parent, name)
+        self._children: dict[str, FileTreeEntry] = {}
+        self._sorted: list[FileTreeEntry] | None = None
+
+    def isFile(self) -> bool:
+        return False
+
+    def isDir(self) -> bool:
+        return True
+
+    def fileType(self) -> int:
+        return FileTreeEntry.DIRECTORY
+
+    def _entries(self) -> list[FileTreeEntry]:
+        if self._sorted is None:
+            self._sorted = sorted(
+                self._children.values(),
+                key=lambda entry: (entry.isFile(), entry.name().casefold()),
+            )
+        return self._sorted
+
+    def _remove_child(self, entry: FileTreeEntry):
+        key = entry.name().casefold()
+        if self._children.get(key) is entry:
+            del self._children[key]
+            self._sorted = None
+
+    def _add_child(self, entry: FileTreeEntry):
+        entry._parent = self
+        self._children[entry.name().casefold()] = entry
+        self._sorted = None
+
+    def __iter__(self) -> Iterator[FileTreeEntry]:
+        return iter(list(self._entries()))
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getitem__(self, index: int) -> FileTreeEntry:
+        return self._entries()[index]
+
+    def find(
+        self, path: str, type: int = FileTreeEntry.FILE_OR_DIRECTORY
+    ) -> FileTreeEntry | None:
+        entry: FileTreeEntry = self
+        for part in _split(path):
+            if not isinstance(entry, IFileTree):
+                return None
+            child = entry._children.get(part.casefold())
+            if child is None:
+                return None
+            entry = child
+        if entry is self or not entry.fileType() & type:
+            return None
+        return entry
+
+    def exists(self, path: str, type: int = FileTreeEntry.FILE_OR_DIRECTORY) -> bool:
+        return self.find(path, type) is not None
+
+    def addDirectory(self, path: str) -> IFileTree:
+        tree = self
+        for part in _split(path):
+            child = tree._children.get(part.casefold())
+            if not isinstance(child, IFileTree):
+                if child is not None:
+                    child.detach()
+                child = IFileTree(tree, part)
+                tree._add_child(child)
+            tree = child
+        return tree
+
+    def addFile(self, path: str, replace_if_exists: bool = False) -> FileTreeEntry:
+        *parents, name = _split(path)
+        tree = self.addDirectory("/".join(parents))
+        existing = tree._children.get(name.casefold())
+        if existing is not None:
+            if not replace_if_exists:
+                return existing
+            existing.detach()
+        entry = FileTreeEntry(tree, name)
+        tree._add_child(entry)
+        return entry
+
+    def insert(
+        self, entry: FileTreeEntry, policy: InsertPolicy = InsertPolicy.FAIL_IF_EXISTS
+    ) -> bool:
+        existing = self._children.get(entry.name().casefold())
+        if existing is entry:
+            return True
+        if existing is not None:
+            if policy == IFileTree.FAIL_IF_EXISTS:
+                return False
+            if (
+                policy == IFileTree.MERGE
+                and isinstance(existing, IFileTree)
+                and isinstance(entry, IFileTree)
+            ):
+                existing.merge(entry)
+                entry.detach()
+                return True
+            existing.detach()
+        entry.detach()
+        self._add_child(entry)
+        return True
+
+    def merge(self, other: IFileTree, overwrites: bool = False) -> int:
+        """Move the entries of `other` into this tree, `other` is left empty."""
+        overwritten = 0
+        for entry in list(other._children.values()):
+            existing = self._children.get(entry.name().casefold())
+            if isinstance(existing, IFileTree) and isinstance(entry, IFileTree):
+                overwritten += existing.merge(entry, overwrites)
+                entry.detach()
+                continue
+            if existing is not None:
+                existing.detach()
+                overwritten += 1
+            entry.detach()
+            self._add_child(entry)
+        return overwritten
+
+    def move(
+        self,
+        entry: FileTreeEntry,
+        path: str,
+        policy: InsertPolicy = InsertPolicy.FAIL_IF_EXISTS,
+    ) -> bool:
+        parts = _split(path)
+        if path.endswith(("/", "\\")) or not parts:
+            return self.addDirectory("/".join(parts)).insert(entry, policy)
+        tree = self.addDirectory("/".join(parts[:-1]))
+        existing = tree._children.get(parts[-1].casefold())
+        if existing is not None and existing is not entry:
+            if policy == IFileTree.FAIL_IF_EXISTS:
+                return False
+            existing.detach()
+        entry.detach()
+        entry._name = parts[-1]
+        tree._add_child(entry)
+        return True
+
+    def copy(
+        self,
+        entry: FileTreeEntry,
+        path: str = "",
+        policy: InsertPolicy = InsertPolicy.FAIL_IF_EXISTS,
+    ) -> FileTreeEntry | None:
+        clone = entry._clone(None)
+        return clone if self.move(clone, path or entry.name(), policy) else None
+
+    def remove(self, entry: str | FileTreeEntry) -> bool:
+        if isinstance(entry, str):
+            found = self.find(entry)
+            if found is None:
+                return False
+            entry = found
+        return entry.detach()
+
+    def removeAll(self, names: list[str]) -> int:
+        return sum(self.remove(name) for name in names)
+
+    def removeIf(self, predicate: Callable[[FileTreeEntry], bool]) -> int:
+        return sum(entry.detach() for entry in self if predicate(entry))
+
+    def clear(self) -> bool:
+        for entry in list(self._children.values()):
+            entry.detach()
+        return True
+
+    def walk(
+        self,
+        callback: Callable[[str, FileTreeEntry], IFileTree.WalkReturn],
+        sep: str = "\\",
+    ):
+        def walk(tree: IFileTree, path: str) -> bool:
+            for entry in tree:
+                result = callback(path, entry)
+                if result == IFileTree.STOP:
+                    return False
+                if isinstance(entry, IFileTree) and result != IFileTree.SKIP:
+                    if not walk(entry, f"{path}{entry.name()}{sep}"):
+                        return False
+            return True
+
+        walk(self, "")
+
+    def _clone(self, parent: IFileTree | None) -> IFileTree:
+        tree = IFileTree(parent, self._name)
+        for child in self:
+            tree._add_child(child._clone(tree))
+        return tree
+
+    def createOrphanTree(self, name: str = "") -> IFileTree:
+        return IFileTree(None, name)
+
+
+def make_tree(paths: list[str]) -> IFileTree:
+    """
+    Build a tree from a list of paths, paths ending with a separator are (empty)
+    directories, other ones are files.
+    """
+    tree = IFileTree()
+    for path in paths:
+        if path.endswith(("/", "\\")):
+            tree.addDirectory(path)
+        else:
+            tree.addFile(path)
+    return tree
+
+
+def install() -> types.ModuleType:
+    """
+    Install this module as `mobase`, unknown names being placeholders.
+
+    Raises:
+        RuntimeError: if the real `mobase` is already loaded.
+    """
+    current = sys.modules.get("mobase")
+    if current is not None:
+        if getattr(current, "__standin__", False):
+            return current
+        raise RuntimeError("the benchmarks cannot run with the real mobase module")
+
+    module = types.ModuleType("mobase", __doc__)
+    module.__dict__.update(
+        {
+            name: value
+            for name, value in globals().items()
+            if not name.startswith("_") and name not in ("install", "make_tree")
+        }
+    )
+    module.__dict__["__standin__"] = True
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        placeholder = _StandInType(name, (Anything,), {})
+        setattr(module, name, placeholder)
+        return placeholder
+
+    module.__dict__["__getattr__"] = __getattr__
+    sys.modules["mobase"] = module
+    return module
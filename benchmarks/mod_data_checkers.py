@@ -0,0 +1,214 @@
+"""
+Benchmark of the mod data checkers and contents of every game, on the fixture trees
+of `benchmarks.fixtures`.
+
+The game plugins are instantiated and initialized with a stand-in organizer, and
+the `mobase.ModDataChecker` and `mobase.ModDataContent` features they register are
+timed. Games that cannot be loaded (e.g. missing dependencies) are reported as
+skipped.
+
+Usage:
+
+    python -m benchmarks.mod_data_checkers [--output report.json] [--repeat N]
+        [--fixture NAME ...] [--game PATTERN ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import sys
+import tempfile
+import traceback
+from typing import Any
+
+from .fixtures import FIXTURES
+from .mobase_standin import (
+    Anything,
+    IFileTree,
+    ModDataChecker,
+    ModDataContent,
+    make_tree,
+)
+from .utils import REPOSITORY, import_module, measure, write_report
+
+
+class _ModList(Anything):
+    def getMod(self, name: str) -> None:
+        return None
+
+
+class _GameFeatures(Anything):
+    def __init__(self):
+        super().__init__()
+        self.features: list[tuple[Any, Any]] = []
+
+    def registerFeature(self, game: Any, feature: Any, priority: int, replace: bool):
+        self.features.append((game, feature))
+        return True
+
+
+class _Organizer(Anything):
+    def __init__(self):
+        super().__init__()
+        self._features = _GameFeatures()
+        self._mod_list = _ModList()
+
+    def gameFeatures(self) -> _GameFeatures:
+        return self._features
+
+    def modList(self) -> _ModList:
+        return self._mod_list
+
+    def pluginDataPath(self) -> str:
+        return tempfile.gettempdir()
+
+
+def load_features(
+    patterns: list[str],
+) -> tuple[list[tuple[str, Any]], list[dict[str, str]]]:
+    """
+    Load the games and collect their checkers and contents.
+
+    Returns:
+        The features with the name of their game, and the skipped modules.
+    """
+    base_game = import_module("basic_game").BasicGame
+
+    features: list[tuple[str, Any]] = []
+    skipped: list[dict[str, str]] = []
+    for path in sorted((REPOSITORY / "games").glob("game_*.py")):
+        if not any(fnmatch.fnmatch(path.stem, pattern) for pattern in patterns):
+            continue
+        try:
+            module = import_module(f"games.{path.stem}")
+        except Exception as e:
+            skipped.append({"module": path.stem, "error": repr(e)})
+            continue
+
+        for obj in vars(module).values():
+            if (
+                not isinstance(obj, type)
+                or not issubclass(obj, base_game)
+                or obj.__module__ != module.__name__
+            ):
+                continue
+            organizer = _Organizer()
+            try:
+                game = obj()
+                game.init(organizer)
+                name = game.gameName()
+            except Exception as e:
+                skipped.append({"module": path.stem, "error": repr(e)})
+                continue
+            for _, feature in organizer.gameFeatures().features:
+                if isinstance(feature, (ModDataChecker, ModDataContent)):
+                    features.append((name, feature))
+    return features, skipped
+
+
+def _time_checker(
+    checker: ModDataChecker, paths: list[str], repeat: int
+) -> dict[str, Any]:
+    result = checker.dataLooksValid(make_tree(paths))
+    entry: dict[str, Any] = {
+        "result": ModDataChecker.CheckReturn(result).name,
+        "dataLooksValid": measure(
+            checker.dataLooksValid, repeat, setup=lambda: make_tree(paths)
+        ),
+    }
+    if result == ModDataChecker.FIXABLE:
+        entry["fix"] = measure(checker.fix, repeat, setup=lambda: make_tree(paths))
+
+        def check_and_fix(tree: IFileTree):
+            # as done by MO2 on installation, checkers may reuse the check in fix
+            checker.dataLooksValid(tree)
+            checker.fix(tree)
+
+        entry["dataLooksValid+fix"] = measure(
+            check_and_fix, repeat, setup=lambda: make_tree(paths)
+        )
+        fixed = checker.fix(make_tree(paths))
+        entry["fixed"] = (
+            ModDataChecker.CheckReturn(checker.dataLooksValid(fixed)).name
+            if isinstance(fixed, IFileTree)
+            else None
+        )
+    return entry
+
+
+def _time_content(
+    content: ModDataContent, paths: list[str], repeat: int
+) -> dict[str, Any]:
+    return {
+        "result": sorted(content.getContentsFor(make_tree(paths))),
+        "getContentsFor": measure(
+            content.getContentsFor, repeat, setup=lambda: make_tree(paths)
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the mod data checkers and contents."
+    )
+    parser.add_argument("--output", "-o", help="JSON report, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    parser.add_argument(
+        "--fixture",
+        "-f",
+        action="append",
+        choices=list(FIXTURES),
+        help="fixtures to run, defaults to all",
+    )
+    parser.add_argument(
+        "--game",
+        "-g",
+        action="append",
+        help="glob patterns of the game modules to run, e.g. 'game_sims4'",
+    )
+    args = parser.parse_args(argv)
+
+    fixtures = {name: FIXTURES[name]() for name in args.fixture or FIXTURES}
+    features, skipped = load_features(args.game or ["*"])
+
+    results: list[dict[str, Any]] = []
+    for game, feature in features:
+        for fixture, paths in fixtures.items():
+            print(f"{game}: {type(feature).__name__} on {fixture}", file=sys.stderr)
+            try:
+                if isinstance(feature, ModDataChecker):
+                    timing = _time_checker(feature, paths, args.repeat)
+                else:
+                    timing = _time_content(feature, paths, args.repeat)
+            except Exception:
+                timing = {"error": traceback.format_exc(limit=-3)}
+            results.append(
+                {
+                    "game": game,
+                    "feature": type(feature).__name__,
+                    "fixture": fixture,
+                    **timing,
+                }
+            )
+
+    write_report(
+        {
+            "repeat": args.repeat,
+            "fixtures": {
+                name: {
+                    "files": sum(not path.endswith("/") for path in paths),
+                    "max_depth": max(path.count("/") for path in paths),
+                }
+                for name, paths in fixtures.items()
+            },
+            "results": results,
+            "skipped": skipped,
+        },
+        args.output,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Benchmark of the classification of entries by `BasicModDataChecker`: the single
+regex per trie node (`RegexPatterns.classify`) against the previous loop over the
+per-category patterns (`ignore`, `unfold`, `valid`, `delete` then `move_match`).
+
+The patterns of the Valheim, Cyberpunk 2077, Subnautica, Baldur's Gate 3 and
+Schedule I checkers are used, on the entries of a synthetic tree whose names are
+instances of the patterns of all these games, or random names.
+
+Usage:
+
+    python -m benchmarks.mod_data_classify [--entries N] [--output report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+from typing import Any
+
+from .mobase_standin import FileTreeEntry, IFileTree, make_tree
+from .mod_data_checkers import load_features
+from .utils import import_module, measure, write_report
+
+GAMES = [
+    "game_valheim",
+    "game_cyberpunk2077",
+    "game_subnautica",
+    "game_baldursgate3",
+    "game_schedule1",
+]
+
+_WORDS = ["mod", "textures", "config", "readme", "plugin", "patch", "data", "ui"]
+_SUFFIXES = ["txt", "dll", "json", "png", "ini", "zip", "md", "bin"]
+
+
+def legacy_classify(patterns: Any, name: str) -> tuple[str, str | None] | None:
+    """Classification of `BasicModDataChecker` before the single regex."""
+    if patterns.ignore.match(name):
+        return ("ignore", None)
+    if patterns.unfold.match(name):
+        return ("unfold", None)
+    if patterns.valid.match(name):
+        return ("valid", None)
+    if patterns.delete.match(name):
+        return ("delete", None)
+    if (key := patterns.move_match(name)) is not None:
+        return ("move", key)
+    return None
+
+
+def _instance(rng: random.Random, glob: str) -> str:
+    """Name matching the given glob (one segment)."""
+
+    def replace(match: re.Match[str]) -> str:
+        token = match[0]
+        if token == "*":
+            return rng.choice(["", rng.choice(_WORDS), f"{rng.choice(_WORDS)}_2"])
+        if token == "?":
+            return rng.choice("abcxyz")
+        return token[1] if token[1] not in "!^" else "_"
+
+    return re.sub(r"\*|\?|\[[^\]]*\]", replace, glob)
+
+
+def synthetic_tree(
+    globs: list[str], entries: int, seed: int = 1, per_directory: int = 100
+) -> IFileTree:
+    """
+    Tree of the given number of entries, in directories of `per_directory` entries,
+    half of the names being instances of the given globs.
+    """
+    rng = random.Random(seed)
+    segments = sorted(
+        {segment for glob in globs for segment in re.split(r"[/\\]", glob)}
+    )
+    paths: list[str] = []
+    seen: set[str] = set()
+    while len(paths) < entries:
+        if rng.random() < 0.5:
+            name = _instance(rng, rng.choice(segments))
+        else:
+            name = f"{rng.choice(_WORDS)}_{rng.randint(0, 9999)}"
+            if rng.random() < 0.8:
+                name += f".{rng.choice(_SUFFIXES)}"
+        path = f"mod_{len(paths) // per_directory:04}/{name}"
+        if not name or path.casefold() in seen:
+            continue
+        seen.add(path.casefold())
+        # a few directories, as in real archives:
+        paths.append(path + "/" if rng.random() < 0.1 else path)
+    return make_tree(paths)
+
+
+def _globs(patterns: Any) -> list[str]:
+    categories = (patterns.ignore, patterns.unfold, patterns.valid, patterns.delete)
+    return [glob for category in categories for glob in category or ()] + list(
+        patterns.move
+    )
+
+
+def _names(tree: IFileTree) -> list[str]:
+    names: list[str] = []
+
+    def collect(path: str, entry: FileTreeEntry) -> IFileTree.WalkReturn:
+        if entry.parent() is not tree:
+            names.append(entry.name().casefold())
+        return IFileTree.CONTINUE
+
+    tree.walk(collect, "/")
+    return names
+
+
+def benchmark(game: str, checker: Any, names: list[str], repeat: int) -> dict[str, Any]:
+    globs = checker._file_patterns
+    patterns = checker._regex_patterns
+
+    def legacy() -> list[Any]:
+        return [legacy_classify(patterns, name) for name in names]
+
+    def single() -> list[Any]:
+        return [patterns.classify(name) for name in names]
+
+    # move_match gives the pattern, classify its target:
+    expected = [
+        None if c is None else (c[0], globs.move[c[1]] if c[0] == "move" else None)
+        for c in legacy()
+    ]
+    if single() != expected:
+        raise RuntimeError(f"different classifications for {game}")
+
+    before = measure(legacy, repeat)
+    after = measure(single, repeat)
+    return {
+        "game": game,
+        "checker": type(checker).__name__,
+        "patterns": len(_globs(globs)),
+        "matched": sum(c is not None for c in expected),
+        "before": before,
+        "after": after,
+        "speedup": round(before["median"] / after["median"], 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of RegexPatterns.classify.")
+    parser.add_argument("--output", "-o", help="JSON report, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    parser.add_argument("--entries", "-n", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    checker_type = import_module("basic_features.basic_mod_data_checker")
+    features, skipped = load_features(GAMES)
+    checkers = [
+        (game, feature)
+        for game, feature in features
+        if isinstance(feature, checker_type.BasicModDataChecker)
+    ]
+
+    all_globs = [
+        glob for _, checker in checkers for glob in _globs(checker._file_patterns)
+    ]
+    names = _names(synthetic_tree(all_globs, args.entries))
+
+    results = [
+        benchmark(game, checker, names, args.repeat) for game, checker in checkers
+    ]
+
+    write_report(
+        {
+            "repeat": args.repeat,
+            "entries": len(names),
+            "results": results,
+            "skipped": skipped,
+        },
+        args.output,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
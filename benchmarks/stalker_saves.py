@@ -0,0 +1,124 @@
+"""
+Synthetic S.T.A.L.K.E.R. Anomaly saves, with the layout read by `XRSave`: a few
+chunks before `CHUNK_OBJECT`, whose first object is the player actor.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from pathlib import Path
+from typing import Any
+
+import lzokay  # pyright: ignore[reportMissingTypeStubs]
+
+CHUNK_OBJECT = 2
+
+_WORDS = [b"stalker", b"zone", b"wpn_ak74", b"ammo", b"bandit", b"duty", b"medkit"]
+
+
+def _str(value: str) -> bytes:
+    return value.encode() + b"\0"
+
+
+def _chunk(id: int, data: bytes) -> bytes:
+    return struct.pack("<II", id, len(data)) + data
+
+
+def records(rng: random.Random, size: int) -> bytes:
+    """Record-like data (ids, positions, names), compressing like real saves."""
+    parts: list[bytes] = []
+    total = 0
+    while total < size:
+        part = (
+            struct.pack(
+                "<HHfff",
+                rng.getrandbits(16),
+                rng.getrandbits(16),
+                rng.random(),
+                rng.random(),
+                rng.random(),
+            )
+            + rng.choice(_WORDS)
+            + str(rng.randint(0, 999)).encode()
+            + b"\0"
+        )
+        parts.append(part)
+        total += len(part)
+    return b"".join(parts)
+
+
+def actor_spawn(
+    version: int = 128,
+    restrictions: int = 50,
+    bones: int = 60,
+    name: str = "Strelok",
+) -> bytes:
+    """Spawn packet of the player actor, see `XRCreatureActor.read_spawn`."""
+    packet = struct.pack("<H", 1) + _str("actor") + _str("single_player") + b"\0"
+    packet += struct.pack("<B", 0xFE) + struct.pack("<6f", 1, 2, 3, 4, 5, 6)
+    packet += struct.pack("<5H", 0, 0, 0xFFFF, 0xFFFF, 32)
+    packet += struct.pack("<H", version)
+    if version > 120:
+        packet += struct.pack("<H", 1)
+    if version > 69:
+        packet += struct.pack("<H", 12)
+    if version > 70:
+        client_data = bytes(range(10))
+        packet += struct.pack("<H" if version > 93 else "<B", len(client_data))
+        packet += client_data
+    if version > 79:
+        packet += struct.pack("<H", 7)
+
+    state = struct.pack("<HfIII", 3, 1.5, 1, 77, 0) + _str("[spawn]\\nfoo")
+    state += struct.pack("<II", 5, 6)
+    if version > 31:
+        state += _str("actors\\stalker_hero") + struct.pack("<B", 1)
+    state += struct.pack("<BBBf", 1, 2, 3, 0.875)
+    state += struct.pack(f"<I{restrictions}H", restrictions, *range(restrictions))
+    state += struct.pack(f"<I{restrictions}H", restrictions, *range(restrictions))
+    state += struct.pack("<HQ", 9, 123456789)
+    state += struct.pack("<I", 15000) + _str("actor_spec") + struct.pack("<I", 0)
+    state += _str("actor_prof") + struct.pack("<iii", 6, 12000, -700)
+    state += _str(name) + b"\1\0"
+    state += _str("anim") + struct.pack("<BH", 4, 3)
+    state += struct.pack("<QH6fH", 0xFFFF, 0, 0, 0, 0, 1, 1, 1, bones)
+    state += bytes(8 * bones) + struct.pack("<H", 0xFFFF)
+    return packet + struct.pack("<H", len(state) + 2) + state
+
+
+def actor_update() -> bytes:
+    """Update packet of the player actor, see `XRCreatureActor.read_update`."""
+    return struct.pack("<HH", 0, 2) + bytes(12) + struct.pack("<fBH", 0.25, 3, 42)
+
+
+def stream(
+    head_size: int = 300_000, tail_size: int = 3_000_000, seed: int = 1, **actor: Any
+) -> bytes:
+    """
+    Decompressed save.
+
+    Args:
+        head_size (optional): Size of the chunks before the object chunk.
+        tail_size (optional): Size of the other objects and chunks.
+        seed (optional): Seed of the generated records.
+        actor: Arguments of `actor_spawn`.
+    """
+    rng = random.Random(seed)
+    spawn = actor_spawn(**actor)
+    update = actor_update()
+    objects = struct.pack("<IH", 1000, len(spawn)) + spawn
+    objects += struct.pack("<H", len(update)) + update + records(rng, tail_size // 2)
+    return (
+        _chunk(0, b"alife" * 10)
+        + _chunk(1, records(rng, head_size))
+        + _chunk(CHUNK_OBJECT, objects)
+        + _chunk(9, records(rng, tail_size // 2))
+    )
+
+
+def write_save(path: Path, data: bytes) -> Path:
+    """Write a compressed save with the given decompressed content."""
+    compressed = lzokay.compress(data)  # pyright: ignore[reportUnknownMemberType]
+    path.write_bytes(struct.pack("<iii", -1, 6, len(data)) + compressed)
+    return path
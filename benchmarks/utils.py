@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any, Callable
+
+from . import mobase_standin
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+PACKAGE = "basic_games"
+"""Name under which the repository is loaded, see `load_package`."""
+
+
+def load_package() -> types.ModuleType:
+    """
+    Load the repository as the `basic_games` package, with the `mobase` stand-in,
+    without running its `__init__.py` (which requires MO2).
+    """
+    mobase_standin.install()
+
+    package = sys.modules.get(PACKAGE)
+    if package is None:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(REPOSITORY)]
+        package.__package__ = PACKAGE
+        sys.modules[PACKAGE] = package
+    return package
+
+
+def import_module(name: str) -> types.ModuleType:
+    """Import a module of the repository, e.g. `games.game_sims4`."""
+    load_package()
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def measure(
+    function: Callable[..., Any],
+    repeat: int,
+    setup: Callable[[], Any] | None = None,
+) -> dict[str, float]:
+    """
+    Time the given function, in milliseconds.
+
+    Args:
+        function: Function to time, called with the result of `setup` if given.
+        repeat: Number of timed calls.
+        setup (optional): Untimed function called before each call, e.g. to build
+            a fresh tree.
+
+    Returns:
+        The minimum, median and mean times.
+    """
+    times: list[float] = []
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            args = () if setup is None else (setup(),)
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            function(*args)
+            times.append((time.perf_counter() - start) * 1000)
+            if gc_enabled:
+                gc.enable()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {
+        "min": round(min(times), 4),
+        "median": round(statistics.median(times), 4),
+        "mean": round(statistics.fmean(times), 4),
+    }
+
+
+def peak_memory(function: Callable[[], Any]) -> int:
+    """Peak memory allocated while calling the given function, in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def write_report(report: dict[str, Any], output: str | None):
+    """Write the given report as JSON to the given file, or to stdout."""
+    report = {"environment": environment(), **report}
+    text = json.dumps(report, indent=2)
+    if output is None or output == "-":
+        print(text)
+    else:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        print(f"Report written to {output}", file=sys.stderr)
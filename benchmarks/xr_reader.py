@@ -0,0 +1,310 @@
+"""
+Benchmark of `XRReader` (memoryview and precompiled `struct.Struct`) against the
+previous reader (bytes slices and `struct.unpack` per value).
+
+The reads of the player actor parse (`XRCreatureActor.read_spawn/read_update`) are
+recorded with the current reader, then replayed on both readers, along with the
+lookup of the object chunk in the decompressed save. The real parse with the
+current reader is timed as well.
+
+Usage:
+
+    python -m benchmarks.xr_reader [--saves DIR] [--output report.json]
+
+Saves (`*.scop`) from the given folder are used, synthetic saves otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+from . import stalker_saves
+from .utils import import_module, measure, write_report
+
+
+class LegacyXRReader:
+    """Reader before the memoryview and `struct.Struct` changes, for reference."""
+
+    def __init__(self, buffer: bytes):
+        self._buffer = buffer
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def _read(self, size: int) -> Tuple[bytes, int]:
+        pos = min(len(self._buffer), self._pos + size)
+        buffer = self._buffer[self._pos : pos]
+        return (buffer, pos)
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self._buffer)
+        if len(self._buffer) <= self._pos:
+            return b""
+        (buffer, pos) = self._read(size)
+        self._pos = pos
+        return buffer
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == 0:
+            self._pos = pos
+        elif whence == 1:
+            self._pos = max(0, self._pos + pos)
+        else:
+            self._pos = max(0, len(self._buffer) + pos)
+        return self._pos
+
+    def elapsed(self) -> int:
+        return len(self._buffer) - self._pos
+
+    def eof(self) -> bool:
+        return self.elapsed() <= 0
+
+    def unpack(self, fmt: struct.Struct) -> Tuple[Any, ...]:
+        # struct.unpack on a slice for each value, as the previous reader did
+        return struct.unpack(fmt.format, self.read(fmt.size))
+
+    def u8(self) -> int:
+        return int(struct.unpack("<B", self.read(1))[0])
+
+    def s8(self) -> int:
+        return int(struct.unpack("<b", self.read(1))[0])
+
+    def u16(self) -> int:
+        return int(struct.unpack("<H", self.read(2))[0])
+
+    def s16(self) -> int:
+        return int(struct.unpack("<h", self.read(2))[0])
+
+    def u32(self) -> int:
+        return int(struct.unpack("<I", self.read(4))[0])
+
+    def s32(self) -> int:
+        return int(struct.unpack("<i", self.read(4))[0])
+
+    def u64(self) -> int:
+        return int(struct.unpack("<Q", self.read(8))[0])
+
+    def s64(self) -> int:
+        return int(struct.unpack("<q", self.read(8))[0])
+
+    def bool(self) -> bool:
+        return bool(struct.unpack("<?", self.read(1))[0])
+
+    def float(self) -> float:
+        return float(struct.unpack("<f", self.read(4))[0])
+
+    def fvec3(self) -> Tuple[float, float, float]:
+        return struct.unpack("<fff", self.read(12))
+
+    def str(self) -> str:
+        chars = bytearray()
+        while not self.eof():
+            c = self.read(1)
+            if c == b"\x00":
+                return str(chars, "utf-8")
+            else:
+                chars += c
+        return ""
+
+    def _array(self, typecode: str, count: int) -> list[int]:
+        fmt = {"B": "<B", "H": "<H", "I": "<I"}[typecode]
+        size = struct.calcsize(fmt)
+        return [int(struct.unpack(fmt, self.read(size))[0]) for _ in range(count)]
+
+
+class LegacyXRStream(LegacyXRReader):
+    def __init__(self, buffer: bytes):
+        super().__init__(buffer)
+        self.last_pos: int = 0
+
+    def find_chunk(self, id: int) -> Optional[int]:
+        dw_type = 0
+        dw_size = 0
+        success = False
+        if self.last_pos != 0:
+            self.seek(self.last_pos)
+            dw_type = self.u32()
+            dw_size = self.u32()
+            if (dw_type & (~(1 << 31))) == id:
+                success = True
+
+        if not success:
+            self.seek(0)
+            while not self.eof():
+                dw_type = self.u32()
+                dw_size = self.u32()
+                if (dw_type & (~(1 << 31))) == id:
+                    success = True
+                    break
+                else:
+                    self.seek(dw_size, io.SEEK_CUR)
+
+            if not success:
+                self.last_pos = 0
+                return None
+
+        if (self._pos + dw_size) < len(self._buffer):
+            self.last_pos = self._pos + dw_size
+        else:
+            self.last_pos = 0
+
+        return dw_size
+
+    def open_chunk(self, id: int) -> Optional[LegacyXRStream]:
+        size = self.find_chunk(id)
+        if size and size != 0:
+            return LegacyXRStream(self.read(size))
+        return None
+
+
+class _Reader(Protocol):
+    _pos: int
+
+    def read(self, size: int = -1) -> Any: ...
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int: ...
+
+    def u16(self) -> int: ...
+
+
+Call = tuple[int, str, tuple[Any, ...]]
+"""`(position, method, arguments)` of a recorded read."""
+
+_RECORDED = (
+    *("u8", "s8", "u16", "s16", "u32", "s32", "u64", "s64", "bool", "float"),
+    *("str", "unpack", "_array", "fvec3", "read", "seek"),
+)
+
+
+def _recorder(reader_type: type[Any]) -> type[Any]:
+    """Subclass of the current reader recording its outermost calls."""
+
+    def wrap(name: str) -> Callable[..., Any]:
+        method = getattr(reader_type, name)
+
+        def recorded(self: Any, *args: Any) -> Any:
+            if self.depth == 0:
+                self.calls.append((self._pos, name, args))
+            self.depth += 1
+            try:
+                return method(self, *args)
+            finally:
+                self.depth -= 1
+
+        return recorded
+
+    def __init__(self: Any, buffer: bytes):
+        reader_type.__init__(self, buffer)  # pyright: ignore[reportCallIssue]
+        self.calls = []
+        self.depth = 0
+
+    namespace: dict[str, Any] = {name: wrap(name) for name in _RECORDED}
+    namespace["__init__"] = __init__
+    return type("RecordingXRReader", (reader_type,), namespace)
+
+
+def _replay(reader: _Reader, calls: list[Call]):
+    for pos, name, args in calls:
+        if reader._pos != pos:  # pyright: ignore[reportPrivateUsage]
+            reader.seek(pos)  # direct position changes, e.g. `_pos -= 2`
+        getattr(reader, name)(*args)
+
+
+def _object_packets(stream: Any) -> tuple[bytes, bytes]:
+    chunk = stream.open_chunk(stalker_saves.CHUNK_OBJECT)
+    chunk.seek(4, io.SEEK_CUR)  # obj_count
+    spawn = bytes(chunk.read(chunk.u16()))
+    update = bytes(chunk.read(chunk.u16()))
+    return spawn, update
+
+
+def benchmark(name: str, data: bytes, repeat: int, number: int) -> dict[str, Any]:
+    xr = import_module("games.stalkeranomaly")
+    spawn, update = _object_packets(xr.XRStream(data))
+
+    recorder = _recorder(xr.XRReader)
+    spawn_reader = recorder(spawn)
+    update_reader = recorder(update)
+    actor = xr.XRCreatureActor()
+    actor.read_spawn(spawn_reader)
+    actor.read_update(update_reader)
+
+    def replay(stream_type: Any, reader_type: Any) -> Callable[[], None]:
+        def run():
+            for _ in range(number):
+                chunk = stream_type(data).open_chunk(stalker_saves.CHUNK_OBJECT)
+                chunk.seek(4, io.SEEK_CUR)
+                _replay(reader_type(chunk.read(chunk.u16())), spawn_reader.calls)
+                _replay(reader_type(chunk.read(chunk.u16())), update_reader.calls)
+
+        return run
+
+    def parse():
+        for _ in range(number):
+            save = object.__new__(xr.XRSave)
+            xr.XRSave.readObject(save, xr.XRStream(data))
+
+    def per_save(timing: dict[str, float]) -> dict[str, float]:
+        return {key: round(value / number, 4) for key, value in timing.items()}
+
+    before = per_save(measure(replay(LegacyXRStream, LegacyXRReader), repeat))
+    after = per_save(measure(replay(xr.XRStream, xr.XRReader), repeat))
+    return {
+        "save": name,
+        "size": len(data),
+        "actor": actor.character_name_str,
+        "reads": len(spawn_reader.calls) + len(update_reader.calls),
+        "before": before,
+        "after": after,
+        "speedup": round(before["median"] / after["median"], 2),
+        "parse": per_save(measure(parse, repeat)),
+    }
+
+
+def _saves(folder: str | None) -> list[tuple[str, bytes]]:
+    if folder is None:
+        return [
+            ("synthetic-early", stalker_saves.stream(50_000, 500_000, bones=20)),
+            ("synthetic-late", stalker_saves.stream(300_000, 3_000_000, bones=120)),
+        ]
+
+    xr = import_module("games.stalkeranomaly")
+    saves: list[tuple[str, bytes]] = []
+    for path in sorted(Path(folder).glob("*.scop")):
+        save = object.__new__(xr.XRSave)
+        save.filepath = path
+        with open(path, "rb") as file:
+            stream = save.readFile(file)
+        if stream is not None:
+            saves.append((path.name, bytes(stream.read())))
+    return saves
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of XRReader.")
+    parser.add_argument("--saves", help="folder of .scop saves")
+    parser.add_argument("--output", "-o", help="JSON report, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    parser.add_argument("--number", "-n", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = [
+        benchmark(name, data, args.repeat, args.number)
+        for name, data in _saves(args.saves)
+    ]
+    write_report(
+        {"repeat": args.repeat, "number": args.number, "results": results},
+        args.output,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Benchmark of the reading of the player actor of S.T.A.L.K.E.R. Anomaly saves: the
+whole save decompressed with `lzokay`, against the pure Python decompression of its
+beginning (`XRSave.decompressHead`), in time and peak memory, to choose the size
+threshold of the latter (`XRSave._partial_threshold`).
+
+Usage:
+
+    python -m benchmarks.xr_save [--saves DIR] [--output report.json]
+
+Saves (`*.scop`) from the given folder are used, synthetic saves with different
+sizes and offsets of the player actor otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from . import stalker_saves
+from .utils import import_module, measure, peak_memory, write_report
+
+# (decompressed size of the chunks before the actor, size of the rest of the save):
+SYNTHETIC = [
+    (50_000, 1_000_000),
+    (300_000, 3_000_000),
+    (500_000, 3_000_000),
+    (50_000, 10_000_000),
+    (300_000, 10_000_000),
+    (500_000, 30_000_000),
+]
+
+
+def benchmark(path: Path, repeat: int) -> dict[str, Any]:
+    xr = import_module("games.stalkeranomaly")
+
+    def read(partial: bool) -> Callable[[], Any]:
+        def run():
+            save = object.__new__(xr.XRSave)
+            save.filepath = path
+            with open(path, "rb") as file:
+                return save.readObject(save.readFile(file, partial=partial))
+
+        return run
+
+    def forced_partial() -> Any:
+        # decompressHead regardless of the size threshold:
+        save = object.__new__(xr.XRSave)
+        save.filepath = path
+        with open(path, "rb") as file:
+            file.seek(12)
+            head = save.decompressHead(file.read(2 * save._partial_limit))
+        return None if head is None else save.readObject(xr.XRStream(head))
+
+    full = read(False)
+    header = path.read_bytes()[:12]
+    size = int.from_bytes(header[8:12], "little", signed=True)
+    actor = full()
+    result: dict[str, Any] = {
+        "save": path.name,
+        "compressed": path.stat().st_size,
+        "decompressed": size,
+        "actor": None if actor is None else actor.character_name_str,
+        "full": {
+            "time": measure(full, repeat),
+            "peak_memory": peak_memory(full),
+        },
+    }
+    if forced_partial() is None:
+        result["partial"] = None
+    else:
+        result["partial"] = {
+            "time": measure(forced_partial, repeat),
+            "peak_memory": peak_memory(forced_partial),
+        }
+    auto = read(True)
+    result["default"] = {
+        "time": measure(auto, repeat),
+        "peak_memory": peak_memory(auto),
+    }
+    return result
+
+
+def _saves(folder: str | None, directory: Path) -> list[Path]:
+    if folder is not None:
+        return sorted(Path(folder).glob("*.scop"))
+    return [
+        stalker_saves.write_save(
+            directory / f"synthetic-{head // 1000}k-{tail // 1000}k.scop",
+            stalker_saves.stream(head, tail),
+        )
+        for head, tail in SYNTHETIC
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of XRSave.")
+    parser.add_argument("--saves", help="folder of .scop saves")
+    parser.add_argument("--output", "-o", help="JSON report, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            benchmark(path, args.repeat) for path in _saves(args.saves, Path(directory))
+        ]
+    write_report({"repeat": args.repeat, "results": results}, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
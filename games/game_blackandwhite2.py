@@ -4,7 +4,6 @@ import struct
 import time
 from collections.abc import Mapping
 from pathlib import Path
-from typing import BinaryIO
 
 from PyQt6.QtCore import QDateTime, QDir, QFile, QFileInfo
 
@@ -163,50 +162,33 @@ class BlackAndWhite2ModDataChecker(mobase.ModDataChecker):
 
 
 class BlackAndWhite2SaveGame(BasicGameSaveGame):
-    _saveInfLayout = {
-        "start": [0x00000000, 0x00000004],
-        "name": [0x00000004, 0x0000002C],
-        "empty": [0x0000002C, 0x00000104],
-        "land": [0x00000104, 0x00000108],
-        "date": [0x00000108, 0x00000110],
-        "empty1": [0x00000110, 0x00000114],
-        "elapsed": [0x00000114, 0x00000118],
-        "empty2": [0x00000108, 0x0000011C],
-    }
+    # "SaveGame.inf" header: name (UTF-16), land, date (NT time), elapsed seconds
+    _saveInfLayout = struct.Struct("<4x40s216xIq4xI4x")
 
     def __init__(self, filepath: Path):
         super().__init__(filepath)
         self._filepath = Path(filepath)
+        self._files: list[str] | None = None
         self.name: str = ""
         self.land: int = -1
         self.elapsed: int = 0
         self.lastsave: int = 0
         with open(self._filepath.joinpath("SaveGame.inf"), "rb") as info:
-            # Name embedded in "SaveGame.inf" with UTF-16 encoding
-            self.name = self.readInf(info, "name").decode("utf-16")
-            # Land number embedded in "SaveGame.inf" as an int written in binary
-            self.land = int.from_bytes(self.readInf(info, "land"), "little")
-            # Getting elapsed time in second
-            self.elapsed = int.from_bytes(self.readInf(info, "elapsed"), "little")
-            # Getting date in 100th of nanosecond need to convert NT time
-            # to UNIX time and offset localtime
-            self.lastsave = int(
-                (
-                    struct.unpack("q", self.readInf(info, "date"))[0] / 10000
-                    - 11644473600000
-                )
-                - (time.localtime().tm_gmtoff * 1000)
+            name, self.land, date, self.elapsed = self._saveInfLayout.unpack(
+                info.read(self._saveInfLayout.size)
             )
-            info.close()
-
-    def readInf(self, inf: BinaryIO, key: str):
-        inf.seek(self._saveInfLayout[key][0])
-        return inf.read(self._saveInfLayout[key][1] - self._saveInfLayout[key][0])
+        self.name = name.decode("utf-16")
+        # date in 100th of nanosecond, need to convert NT time to UNIX time and
+        # offset localtime
+        self.lastsave = int(
+            (date / 10000 - 11644473600000) - (time.localtime().tm_gmtoff * 1000)
+        )
 
     def allFiles(self) -> list[str]:
-        files = [str(file) for file in self._filepath.glob("./*")]
-        files.append(str(self._filepath))
-        return files
+        if self._files is None:
+            self._files = [str(file) for file in self._filepath.glob("./*")]
+            self._files.append(str(self._filepath))
+        return list(self._files)
 
     def getCreationTime(self) -> QDateTime:
         return QDateTime.fromMSecsSinceEpoch(self.lastsave)
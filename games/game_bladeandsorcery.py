@@ -1,4 +1,3 @@
-import json
 from collections.abc import Mapping
 from pathlib import Path
 
@@ -11,22 +10,29 @@ from ..basic_features.basic_save_game_info import (
     BasicGameSaveGameInfo,
     format_date,
 )
+from ..basic_features.json_utils import find_json_values
 from ..basic_game import BasicGame
 
 
 class BaSSaveGame(BasicGameSaveGame):
+    # only these are read, the rest of the save (inventory, etc.) is skipped
+    _fields = (
+        ("mode", "saveData", "gameModeId"),
+        ("customization", "creatureId"),
+        ("customization", "ethnicGroupId"),
+        ("playTime",),
+    )
+
     def __init__(self, filepath: Path):
         super().__init__(filepath)
-        with open(self._filepath, "rb") as save:
-            save_data = json.load(save)
-        self._gameMode = save_data["mode"]["saveData"]["gameModeId"]
+        with open(self._filepath, encoding="utf-8-sig") as save:
+            save_data = find_json_values(save, self._fields)
+        self._gameMode = save_data[self._fields[0]]
         self._gender = (
-            "Male"
-            if save_data["customization"]["creatureId"] == "PlayerDefaultMale"
-            else "Female"
+            "Male" if save_data[self._fields[1]] == "PlayerDefaultMale" else "Female"
         )
-        self._ethnicity = save_data["customization"]["ethnicGroupId"]
-        h, m, s = save_data["playTime"].split(":")
+        self._ethnicity = save_data[self._fields[2]]
+        h, m, s = save_data[self._fields[3]].split(":")
         self._elapsed = (float(h), int(m), float(s))
         f_stat = self._filepath.stat()
         self._created = f_stat.st_birthtime
@@ -4,9 +4,11 @@ import re
 import shutil
 import tempfile
 import textwrap
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal, TypeVar
 
@@ -27,6 +29,7 @@ from ..basic_features.basic_save_game_info import (
     BasicGameSaveGameInfo,
     format_date,
 )
+from ..basic_features.json_utils import find_json_values
 from ..basic_game import BasicGame
 
 
@@ -68,48 +71,112 @@ def time_from_seconds(s: int | float) -> str:
     return f"{h:02}:{m:02}:{s:02}"
 
 
-def parse_cyberpunk_save_metadata(save_path: Path, save: mobase.ISaveGame):
-    metadata_file = save_path / "metadata.9.json"
+def _mtime(path: Path) -> float | None:
     try:
-        with open(metadata_file) as file:
-            meta_data = json.load(file)["Data"]["metadata"]
-            name = meta_data["name"]
-            if name != (save_name := save.getName()):
-                name = f"{save_name}  ({name})"
-            return {
-                "Name": name,
-                "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
-                "Play Time": time_from_seconds(meta_data["playthroughTime"]),
-                "Quest": meta_data["trackedQuestEntry"],
-                "Level": int(meta_data["level"]),
-                "Street Cred": int(meta_data["streetCred"]),
-                "Life Path": meta_data["lifePath"],
-                "Difficulty": meta_data["difficulty"],
-                "Gender": f"{meta_data['bodyGender']} / {meta_data['brainGender']}",
-                "Game version": meta_data["buildPatch"],
-            }
-    except (FileNotFoundError, json.JSONDecodeError):
+        return path.stat().st_mtime
+    except FileNotFoundError:
         return None
 
 
-class CyberpunkSaveGame(BasicGameSaveGame):
+class CyberpunkSaveRecord:
+    """Files of a save directory, parsed (lazily) once and shared by the save and the
+    save info widget. Records are cached by directory, until one of the files is
+    modified, with least-recently-used eviction.
+    """
+
+    _max_records = 512
+    _records: OrderedDict[Path, "CyberpunkSaveRecord"] = OrderedDict()
+    _records_lock = threading.Lock()
+
+    _save_file = "sav.dat"
     _name_file = "NamedSave.txt"  # from mod: Named Saves
+    _metadata_file = "metadata.9.json"
+
+    def __init__(self, save_dir: Path, mtimes: tuple[float | None, ...]):
+        self._save_dir = save_dir
+        self._mtimes = mtimes
+
+    @classmethod
+    def get(cls, save_dir: Path) -> "CyberpunkSaveRecord":
+        mtimes = tuple(
+            _mtime(save_dir / file)
+            for file in (cls._save_file, cls._name_file, cls._metadata_file)
+        )
+        with cls._records_lock:
+            record = cls._records.get(save_dir)
+            if record is None or record._mtimes != mtimes:
+                record = cls._records[save_dir] = cls(save_dir, mtimes)
+                if len(cls._records) > cls._max_records:
+                    cls._records.popitem(last=False)
+            else:
+                cls._records.move_to_end(save_dir)
+            return record
+
+    @property
+    def saved_at(self) -> float:
+        """Modification time of the save file."""
+        return self._mtimes[0] or 0
+
+    @cached_property
+    def name(self) -> str:
+        """Custom name from Named Saves, or an empty string."""
+        try:
+            with open(self._save_dir / self._name_file) as file:
+                return file.readline()
+        except FileNotFoundError:
+            return ""
+
+    @cached_property
+    def metadata(self) -> dict[str, Any] | None:
+        """Formatted metadata for the save info widget, `None` if missing or
+        invalid."""
+        try:
+            with open(self._save_dir / self._metadata_file) as file:
+                meta_data = find_json_values(file, [("Data", "metadata")])[
+                    "Data", "metadata"
+                ]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return {
+            "Name": meta_data["name"],
+            "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
+            "Play Time": time_from_seconds(meta_data["playthroughTime"]),
+            "Quest": meta_data["trackedQuestEntry"],
+            "Level": int(meta_data["level"]),
+            "Street Cred": int(meta_data["streetCred"]),
+            "Life Path": meta_data["lifePath"],
+            "Difficulty": meta_data["difficulty"],
+            "Gender": f"{meta_data['bodyGender']} / {meta_data['brainGender']}",
+            "Game version": meta_data["buildPatch"],
+        }
 
+
+def parse_cyberpunk_save_metadata(save_path: Path, save: mobase.ISaveGame):
+    save_name = save.getName()
+
+    def read_metadata() -> dict[str, Any] | None:
+        # run by the save info widget in a worker thread
+        metadata = CyberpunkSaveRecord.get(save_path).metadata
+        if metadata is None:
+            return None
+        name = metadata["Name"]
+        if name != save_name:
+            name = f"{save_name}  ({name})"
+        return metadata | {"Name": name}
+
+    return read_metadata
+
+
+class CyberpunkSaveGame(BasicGameSaveGame):
     def __init__(self, filepath: Path):
         super().__init__(filepath)
-        try:  # Custom name from Named Saves
-            with open(filepath / self._name_file) as file:
-                self._name = file.readline()
-        except FileNotFoundError:
-            self._name = ""
+        self._record = CyberpunkSaveRecord.get(filepath)
 
     def getName(self) -> str:
-        return self._name or super().getName()
+        return self._record.name or super().getName()
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(
-            int((self._filepath / "sav.dat").stat().st_mtime)
-        )
+        return QDateTime.fromSecsSinceEpoch(int(self._record.saved_at))
 
 
 @dataclass
@@ -1,10 +1,13 @@
-import json
+import struct
+from bisect import bisect_right
 from pathlib import Path
+from typing import Iterable
 
 from PyQt6.QtCore import QDir, QFileInfo
 
 import mobase
 
+from ..basic_features.json_utils import find_json_values
 from ..basic_game import BasicGame, BasicGameSaveGame
 from ..steam_utils import find_steam_path
 
@@ -77,78 +80,110 @@ class DarkestDungeonSaveGame(BasicGameSaveGame):
             return magic == b"\x01\xb1\x00\x00"
 
     def loadJSONSaveFile(self, dataPath: Path):
-        text = dataPath.read_text()
-        content = json.loads(text)
-        data = content["data"]
-        self.name = str(data["estatename"])
+        # the name is near the start, no need to load the whole roster
+        with dataPath.open() as fp:
+            values = find_json_values(fp, [("data", "estatename")])
+        if ("data", "estatename") in values:
+            self.name = str(values["data", "estatename"])
 
     def loadBinarySaveFile(self, dataPath: Path):
-        # see https://github.com/robojumper/DarkestDungeonSaveEditor
-        with dataPath.open(mode="rb") as fp:
-            # read Header
-
-            # skip to headerLength
-            fp.seek(8, 0)
-            headerLength = int.from_bytes(fp.read(4), "little")
-            if headerLength != 64:
-                raise ValueError("Header Length is not 64: " + str(headerLength))
-            fp.seek(4, 1)
-
-            # meta1Size = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
-            # numMeta1Entries = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
+        fields = self.readBinaryFields(dataPath, ["estatename"])
+        if "estatename" in fields:
+            value = fields["estatename"]
+            # int32 length followed by a null terminated string
+            valueLength = int.from_bytes(value[:4], "little")
+            self.name = bytes.decode(value[4 : 4 + valueLength - 1], "utf-8")
 
-            meta1Offset = int.from_bytes(fp.read(4), "little")
-            fp.seek(16, 1)
-            numMeta2Entries = int.from_bytes(fp.read(4), "little")
-            meta2Offset = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
+    # see https://github.com/robojumper/DarkestDungeonSaveEditor
+    _binaryHeader = struct.Struct("<8xI4xIII16xII4xII")
 
-            # dataLength = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
+    @staticmethod
+    def fieldNameHash(name: str) -> int:
+        """Hash of a field name, as stored in the Meta2 entries."""
+        nameHash = 0
+        for c in name.encode("utf-8"):
+            nameHash = (nameHash * 53 + c) & 0xFFFFFFFF
+        return nameHash
+
+    @classmethod
+    def readBinaryFields(cls, dataPath: Path, names: Iterable[str]) -> dict[str, bytes]:
+        """Read the raw data of several fields of a binary save in one pass.
+
+        Meta2 entries are matched on the hash of the field name before reading and
+        comparing the name itself, only the matching entries are read from the data
+        block.
+
+        Args:
+            dataPath: Path to the binary save file.
+            names: Names of the fields to read, the first field with each name is
+                used.
+
+        Returns:
+            The raw data (after the field name) of each field found, up to the next
+            field.
+        """
+        wanted = set(names)
+        hashes = {cls.fieldNameHash(name) for name in wanted}
+        fields: dict[str, bytes] = {}
 
-            dataOffset = int.from_bytes(fp.read(4), "little")
+        with dataPath.open(mode="rb") as fp:
+            # read the header and the Meta1/Meta2 blocks at once
+            header = fp.read(cls._binaryHeader.size)
+            (
+                headerLength,
+                _meta1Size,
+                _numMeta1Entries,
+                meta1Offset,
+                numMeta2Entries,
+                meta2Offset,
+                dataLength,
+                dataOffset,
+            ) = cls._binaryHeader.unpack(header)
+            if headerLength != 64:
+                raise ValueError("Header Length is not 64: " + str(headerLength))
 
-            # read Meta1 Block
-            fp.seek(meta1Offset, 0)
             meta1DataLength = meta2Offset - meta1Offset
             if meta1DataLength % 16 != 0:
                 raise ValueError(
                     "Meta1 has wrong number of bytes: " + str(meta1DataLength)
                 )
-
-            # read Meta2 Block
-            fp.seek(meta2Offset, 0)
             meta2DataLength = dataOffset - meta2Offset
             if meta2DataLength % 12 != 0:
                 raise ValueError(
                     "Meta2 has wrong number of bytes: " + str(meta2DataLength)
                 )
-            meta2List: list[tuple[int, int, int]] = []
-            for _ in range(numMeta2Entries):
-                entryHash = int.from_bytes(fp.read(4), "little")
-                offset = int.from_bytes(fp.read(4), "little")
-                fieldInfo = int.from_bytes(fp.read(4), "little")
-                meta2List.append((entryHash, offset, fieldInfo))
-
-            # read Data
-            fp.seek(dataOffset, 0)
-            for x in range(numMeta2Entries):
-                meta2Entry = meta2List[x]
-                fp.seek(dataOffset + meta2Entry[1], 0)
-                nameLength = (meta2Entry[2] & 0b11111111100) >> 2
+
+            meta = header + fp.read(dataOffset - len(header))
+            meta2List = list(
+                struct.iter_unpack(
+                    "<III", meta[meta2Offset : meta2Offset + 12 * numMeta2Entries]
+                )
+            )
+            offsets = sorted(offset for _, offset, _ in meta2List)
+
+            def readField(offset: int, fieldInfo: int) -> tuple[str, bytes]:
+                end = bisect_right(offsets, offset)
+                end = offsets[end] if end < len(offsets) else dataLength
+                fp.seek(dataOffset + offset, 0)
+                data = fp.read(end - offset)
+                nameLength = (fieldInfo & 0b11111111100) >> 2
                 # null terminated string
-                nameBytes = fp.read(nameLength - 1)
-                fp.seek(1, 1)
-                name = bytes.decode(nameBytes, "utf-8")
-                if name != "estatename":
-                    continue
-                valueLength = int.from_bytes(fp.read(4), "little")
-                valueBytes = fp.read(valueLength - 1)
-                value = bytes.decode(valueBytes, "utf-8")
-                self.name = value
-                break
+                name = bytes.decode(data[: nameLength - 1], "utf-8")
+                return name, data[nameLength:]
+
+            candidates = [entry for entry in meta2List if entry[0] in hashes]
+            if not candidates:
+                # no hash matches, compare all the names to be safe
+                candidates = meta2List
+
+            for _, offset, fieldInfo in candidates:
+                name, value = readField(offset, fieldInfo)
+                if name in wanted and name not in fields:
+                    fields[name] = value
+                    if len(fields) == len(wanted):
+                        break
+
+        return fields
 
     def getName(self) -> str:
         if self.name == "":
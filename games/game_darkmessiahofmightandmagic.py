@@ -44,5 +44,8 @@ class DarkMessiahOfMightAndMagicGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._register_feature(BasicGameSaveGameInfo(self._read_save_tga))
+        # the TGA is read by the save info widget in a worker thread
+        self._register_feature(
+            BasicGameSaveGameInfo(lambda p: lambda: self._read_save_tga(p))
+        )
         return True
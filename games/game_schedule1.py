@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from typing import Any
 
 from PyQt6.QtCore import QDir
 
@@ -10,23 +11,28 @@ from ..basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
 )
+from ..basic_features.json_utils import find_json_values
 from ..basic_game import BasicGame
 
 
 def parse_schedule1_save_metadata(save_path: Path, save: mobase.ISaveGame):
-    metadata_file = save_path / "Game.json"
-    try:
-        with open(metadata_file) as file:
-            meta_data = json.load(file)
-            name = meta_data["OrganisationName"]
-            if name != (save_name := save.getName()):
-                name = f"{save_name}  ({name})"
+    def read_metadata() -> dict[str, Any] | None:
+        # run by the save info widget in a worker thread, the name of the save is
+        # also read from Game.json (see Schedule1SaveGame.getName)
+        metadata_file = save_path / "Game.json"
+        try:
+            with open(metadata_file) as file:
+                meta_data = find_json_values(
+                    file, [("OrganisationName",), ("GameVersion",)]
+                )
             return {
-                "Name": name,
-                "Game version": meta_data["GameVersion"],
+                "Name": meta_data[("OrganisationName",)],
+                "Game version": meta_data[("GameVersion",)],
             }
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    return read_metadata
 
 
 class Schedule1SaveGame(BasicGameSaveGame):
@@ -34,8 +40,8 @@ class Schedule1SaveGame(BasicGameSaveGame):
         metadata_file = self._filepath / "Game.json"
         try:
             with open(metadata_file) as file:
-                meta_data = json.load(file)
-                return meta_data["OrganisationName"]
+                meta_data = find_json_values(file, [("OrganisationName",)])
+            return meta_data[("OrganisationName",)]
         except (FileNotFoundError, json.JSONDecodeError):
             return (
                 f"[{self.getSaveGroupIdentifier().rstrip('s')}] {self._filepath.stem}"
@@ -1,6 +1,6 @@
+import re
 from collections.abc import Callable
 from enum import IntEnum
-from re import match
 from typing import Any, List, Set, cast
 
 from mobase import (
@@ -13,6 +13,7 @@ from mobase import (
     VersionInfo,
 )
 
+from ..basic_features.basic_mod_data_content import ModDataContentCache
 from ..basic_game import BasicGame
 
 
@@ -47,7 +48,7 @@ class TS4Game(BasicGame):
     def init(self, organizer: IOrganizer):
         if super().init(organizer):
             self._register_feature(TS4ModDataChecker())
-            self._register_feature(TS4ModDataContent())
+            self._register_feature(ModDataContentCache(TS4ModDataContent(), organizer))
             return True
         return False
 
@@ -55,7 +56,13 @@ class TS4Game(BasicGame):
 class TS4ModDataChecker(ModDataChecker):
     # .package files are allowed at a maximum depth of 5 subfolders, script files can be at most one level deep
     # The first capturing group lazily captures any parent folders exceeding that depth, see below
-    _fixableOrValid = r"(?i)^(.*?)((?:[^\\]+\\){0,5}[^\\]*\.package|(?:[^\\]+\\)?[^\\]*\.ts4script|(?:[^\\]+\\)scripts\\.*\.py)$"
+    _fixableOrValid = re.compile(
+        r"(?i)^(.*?)((?:[^\\]+\\){0,5}[^\\]*\.package|(?:[^\\]+\\)?[^\\]*\.ts4script|(?:[^\\]+\\)scripts\\.*\.py)$"
+    )
+    # Only entries with these suffixes can match, and the maximum number of parent
+    # folders of a valid entry, see _fixableOrValid
+    _maxDepths = {".package": 5, ".ts4script": 1, ".py": -1}
+    _suffixes = tuple(_maxDepths)
 
     def dataLooksValid(self, filetree: IFileTree) -> ModDataChecker.CheckReturn:
         return cast(
@@ -95,11 +102,23 @@ class TS4ModDataChecker(ModDataChecker):
             else:
                 actionCallback()
 
+        # Moves are done once the walk is over, rather than while walking the tree
+        moves: list[tuple[FileTreeEntry, str]] = []
+
         def fixOrValidateEntry(
             parentPath: str, entry: FileTreeEntry
         ) -> IFileTree.WalkReturn:
-            path = f"{parentPath}{entry.name()}"
-            fixableOrValid = match(self._fixableOrValid, path)
+            name = entry.name()
+            lowerName = name.lower()
+            if not lowerName.endswith(self._suffixes):
+                return walkReturn
+            # Most entries are packages or scripts within the maximum depth, these are
+            # valid without matching their path
+            suffix = lowerName[lowerName.rfind(".") :]
+            if parentPath.count("\\") <= self._maxDepths[suffix]:
+                setValidationResult(ValidationResult.VALID)
+                return walkReturn
+            fixableOrValid = self._fixableOrValid.match(f"{parentPath}{name}")
             if fixableOrValid:
                 match fixableOrValid.groups():
                     case ["", _]:
@@ -109,13 +128,15 @@ class TS4ModDataChecker(ModDataChecker):
                         # E.g. a/b/c.ts4script will be moved to b/c.ts4script
                         setValidationResult(
                             ValidationResult.FIXABLE,
-                            lambda: tree.move(entry, innerPath),
+                            lambda: moves.append((entry, innerPath)),
                         )
                     case _:
                         pass
             return walkReturn
 
         tree.walk(fixOrValidateEntry)
+        for entry, innerPath in moves:
+            tree.move(entry, innerPath)
 
         if validateMode:
             return checkReturn
@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 import mobase
 
+from ..basic_features import BasicModDataContent, ContentRule
+from ..basic_features.basic_mod_data_content import ModDataContentCache
 from ..basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
@@ -71,61 +73,39 @@ class Content(IntEnum):
     CONFIG = 6
 
 
-class StalkerAnomalyModDataContent(mobase.ModDataContent):
-    content: list[int] = []
-
-    def getAllContents(self) -> list[mobase.ModDataContent.Content]:
-        return [
-            mobase.ModDataContent.Content(
-                Content.INTERFACE, "Interface", ":/MO/gui/content/interface"
-            ),
-            mobase.ModDataContent.Content(
-                Content.TEXTURE, "Textures", ":/MO/gui/content/texture"
-            ),
-            mobase.ModDataContent.Content(
-                Content.MESH, "Meshes", ":/MO/gui/content/mesh"
-            ),
-            mobase.ModDataContent.Content(
-                Content.SCRIPT, "Scripts", ":/MO/gui/content/script"
-            ),
-            mobase.ModDataContent.Content(
-                Content.SOUND, "Sounds", ":/MO/gui/content/sound"
-            ),
-            mobase.ModDataContent.Content(Content.MCM, "MCM", ":/MO/gui/content/menu"),
-            mobase.ModDataContent.Content(
-                Content.CONFIG, "Configs", ":/MO/gui/content/inifile"
-            ),
-        ]
-
-    def walkContent(
-        self, path: str, entry: mobase.FileTreeEntry
-    ) -> mobase.IFileTree.WalkReturn:
-        name = entry.name().lower()
-        if entry.isFile():
-            ext = entry.suffix().lower()
-            if ext in ["dds", "thm"]:
-                self.content.append(Content.TEXTURE)
-                if path.startswith("gamedata/textures/ui"):
-                    self.content.append(Content.INTERFACE)
-            elif ext in ["omf", "ogf"]:
-                self.content.append(Content.MESH)
-            elif ext in ["script"]:
-                self.content.append(Content.SCRIPT)
-                if "_mcm" in name:
-                    self.content.append(Content.MCM)
-            elif ext in ["ogg"]:
-                self.content.append(Content.SOUND)
-            elif ext in ["ltx", "xml"]:
-                self.content.append(Content.CONFIG)
-                if path.startswith("gamedata/configs/ui"):
-                    self.content.append(Content.INTERFACE)
-
-        return mobase.IFileTree.WalkReturn.CONTINUE
-
-    def getContentsFor(self, filetree: mobase.IFileTree) -> list[int]:
-        self.content = []
-        filetree.walk(self.walkContent, "/")
-        return self.content
+class StalkerAnomalyModDataContent(BasicModDataContent):
+    def __init__(self):
+        super().__init__(
+            [
+                (Content.INTERFACE, "Interface", ":/MO/gui/content/interface"),
+                (Content.TEXTURE, "Textures", ":/MO/gui/content/texture"),
+                (Content.MESH, "Meshes", ":/MO/gui/content/mesh"),
+                (Content.SCRIPT, "Scripts", ":/MO/gui/content/script"),
+                (Content.SOUND, "Sounds", ":/MO/gui/content/sound"),
+                (Content.MCM, "MCM", ":/MO/gui/content/menu"),
+                (Content.CONFIG, "Configs", ":/MO/gui/content/inifile"),
+            ],
+            [
+                ContentRule(Content.TEXTURE, recursive=True, extensions=["dds", "thm"]),
+                ContentRule(
+                    Content.INTERFACE,
+                    "gamedata/textures/ui*",
+                    recursive=True,
+                    extensions=["dds", "thm"],
+                ),
+                ContentRule(Content.MESH, recursive=True, extensions=["omf", "ogf"]),
+                ContentRule(Content.SCRIPT, recursive=True, extensions=["script"]),
+                ContentRule(Content.MCM, recursive=True, files=["*_mcm*.script"]),
+                ContentRule(Content.SOUND, recursive=True, extensions=["ogg"]),
+                ContentRule(Content.CONFIG, recursive=True, extensions=["ltx", "xml"]),
+                ContentRule(
+                    Content.INTERFACE,
+                    "gamedata/configs/ui*",
+                    recursive=True,
+                    extensions=["ltx", "xml"],
+                ),
+            ],
+        )
 
 
 class StalkerAnomalySaveGame(BasicGameSaveGame):
@@ -240,7 +220,9 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
     def init(self, organizer: mobase.IOrganizer):
         BasicGame.init(self, organizer)
         self._register_feature(StalkerAnomalyModDataChecker())
-        self._register_feature(StalkerAnomalyModDataContent())
+        self._register_feature(
+            ModDataContentCache(StalkerAnomalyModDataContent(), organizer)
+        )
         self._register_feature(StalkerAnomalySaveGameInfo())
         organizer.onAboutToRun(lambda _str: self.aboutToRun(_str))
         return True
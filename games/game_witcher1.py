@@ -1,17 +1,37 @@
+import hashlib
+import os
+import struct
+from functools import cache
 from pathlib import Path
-from typing import BinaryIO, List
+from typing import BinaryIO, Iterable, List
 
-from PyQt6.QtCore import QDir, QFileInfo
+from PyQt6.QtCore import QDir, QFileInfo, Qt
+from PyQt6.QtGui import QImage, QImageReader
 
 import mobase
 
+from ..basic_features import BasicGameSaveGameInfo
+from ..basic_features.basic_save_game_info import DeferredPreview
 from ..basic_game import BasicGame, BasicGameSaveGame
 
 
 class Witcher1SaveGame(BasicGameSaveGame):
+    # magic, version, data offset, unknown values, "Lightning Storm" and area name
+    # (twice), strings are fixed size UTF-16
+    _header = struct.Struct("<4sIQ8x16x2048s2048s2048s")
+
+    # resource table at the data offset: count, unknown value, then for each
+    # resource its name (length prefixed) followed by its size and offset (not
+    # confirmed, the preview is simply skipped if the table does not match)
+    _tableHeader = struct.Struct("<I4x")
+    _resourceEntry = struct.Struct("<II")
+
+    _previewFormats = ("tga", "dds", "bmp", "png", "jpg")
+
     def __init__(self, filepath: Path):
         super().__init__(filepath)
         self.areaName: str = ""
+        self.dataOffset: int = 0
         self.parseSaveFile(filepath)
 
     @staticmethod
@@ -19,42 +39,145 @@ class Witcher1SaveGame(BasicGameSaveGame):
         return int.from_bytes(fp.read(length), "little")
 
     @staticmethod
-    def readFixedString(fp: BinaryIO, length: int) -> str:
-        b: bytes = fp.read(length)
-        res = b.decode("utf-16")
-        return res.rstrip("\0")
+    def decodeFixedString(b: bytes) -> str:
+        return b.decode("utf-16").rstrip("\0")
 
     def parseSaveFile(self, filepath: Path):
         # https://github.com/xoreos/xoreos/blob/82bd991052732ab1f8f75f512b3dfabfcc92ae8f/src/aurora/thewitchersavefile.cpp#L60
         with filepath.open(mode="rb") as fp:
-            magic = fp.read(4)
-            if magic != b"RGMH":
-                raise ValueError("Invalid TheWitcherSave file!")
+            try:
+                magic, version, dataOffset, lightningStorm, areaName1, areaName2 = (
+                    self._header.unpack(fp.read(self._header.size))
+                )
+            except struct.error as e:
+                raise ValueError("Invalid TheWitcherSave file!") from e
+
+        if magic != b"RGMH" or version != 1:
+            raise ValueError("Invalid TheWitcherSave file!")
+
+        if self.decodeFixedString(lightningStorm) != "Lightning Storm":
+            raise ValueError('Missing "Lightning Storm"')
+
+        areaName = self.decodeFixedString(areaName1)
+        if areaName != self.decodeFixedString(areaName2):
+            raise ValueError("Invalid Area Name!")
+
+        self.areaName = areaName
+        self.dataOffset = dataOffset
+
+    def readPreview(self) -> QImage | None:
+        """
+        Decode the preview image embedded in the save, if any.
+
+        Returns None if the resource table does not match the file (count, offsets
+        or sizes out of bounds) or if Qt cannot decode the image format.
+        """
+        try:
+            with Path(self.getFilepath()).open(mode="rb") as fp:
+                return self._readPreview(fp)
+        except (OSError, struct.error, UnicodeDecodeError):
+            return None
+
+    def _readPreview(self, fp: BinaryIO) -> QImage | None:
+        fileSize = os.fstat(fp.fileno()).st_size
+        tableStart = self.dataOffset + self._tableHeader.size
+        if tableStart > fileSize:
+            return None
+
+        fp.seek(self.dataOffset)
+        (count,) = self._tableHeader.unpack(fp.read(self._tableHeader.size))
+
+        # each entry is at least its name length, size and offset:
+        if count * (4 + self._resourceEntry.size) > fileSize - tableStart:
+            return None
+
+        for _ in range(count):
+            length = self.readInt(fp)
+            if fp.tell() + length + self._resourceEntry.size > fileSize:
+                return None
+            name = fp.read(length).decode("ascii")
+            size, offset = self._resourceEntry.unpack(fp.read(self._resourceEntry.size))
+            suffix = name.rpartition(".")[2].casefold()
+            if suffix not in self._previewFormats:
+                continue
+            if (
+                size == 0
+                or offset < self._header.size
+                or offset + size > fileSize
+                or suffix.encode() not in self.supportedImageFormats()
+            ):
+                return None
+            fp.seek(offset)
+            image = QImage.fromData(fp.read(size), suffix.upper())
+            return None if image.isNull() else image
+        return None
 
-            version = self.readInt(fp)
-            if version != 1:
-                raise ValueError("Invalid TheWitcherSave file!")
+    @staticmethod
+    @cache
+    def supportedImageFormats() -> frozenset[bytes]:
+        # TGA and DDS are only available with the Qt image format plugins
+        return frozenset(
+            bytes(f.data()).lower() for f in QImageReader.supportedImageFormats()
+        )
 
-            # TODO: get the preview image
-            # dataOffset = self.readInt(fp, 8)
-            fp.seek(8, 1)
-            fp.seek(8, 1)
-            fp.seek(4 * 4, 1)
+    def getName(self) -> str:
+        return self.areaName
 
-            lightningStorm = self.readFixedString(fp, 2048)
-            if lightningStorm != "Lightning Storm":
-                raise ValueError('Missing "Lightning Storm"')
 
-            areaName1 = self.readFixedString(fp, 2048)
-            areaName2 = self.readFixedString(fp, 2048)
+class Witcher1PreviewCache:
+    """On-disk cache of the save previews.
 
-            if areaName1 != areaName2:
-                raise ValueError("Invalid Area Name!")
+    Extracting the preview requires reading the (large) save file, so thumbnails are
+    stored as PNG files, in a folder per save folder, keyed by save name and
+    modification time.
 
-            self.areaName = areaName1
+    `get` reads and writes files, it is run by the save info widget in its worker
+    thread (see `Witcher1Game._getPreview`).
+    """
 
-    def getName(self) -> str:
-        return self.areaName
+    def __init__(self, cacheDir: Path, width: int = 320):
+        self._cacheDir = cacheDir
+        self._width = width
+
+    @staticmethod
+    def _key(value: str) -> str:
+        return hashlib.sha1(value.casefold().encode()).hexdigest()
+
+    def _folder(self, savesFolder: Path) -> Path:
+        return self._cacheDir.joinpath(self._key(str(savesFolder)))
+
+    def get(self, savepath: Path) -> Path | QImage | None:
+        folder = self._folder(savepath.parent)
+        key = self._key(savepath.name)
+        thumbnail = folder.joinpath(f"{key}-{savepath.stat().st_mtime_ns}.png")
+        if thumbnail.exists():
+            return thumbnail
+
+        # remove thumbnails of previous versions of the save
+        for previous in folder.glob(f"{key}-*.png"):
+            previous.unlink(missing_ok=True)
+
+        image = Witcher1SaveGame(savepath).readPreview()
+        if image is None:
+            return None
+        if image.width() > self._width:
+            image = image.scaledToWidth(
+                self._width, Qt.TransformationMode.SmoothTransformation
+            )
+
+        folder.mkdir(parents=True, exist_ok=True)
+        image.save(str(thumbnail), "PNG")
+        return image
+
+    def prune(self, savesFolder: Path, savepaths: Iterable[Path]):
+        """Remove the thumbnails of the saves no longer in the given folder."""
+        folder = self._folder(savesFolder)
+        if not folder.is_dir():
+            return
+        keys = {self._key(path.name) for path in savepaths}
+        for thumbnail in folder.glob("*.png"):
+            if thumbnail.name.partition("-")[0] not in keys:
+                thumbnail.unlink(missing_ok=True)
 
 
 class Witcher1Game(BasicGame):
@@ -80,14 +203,36 @@ class Witcher1Game(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
+        self._previews = Witcher1PreviewCache(
+            Path(organizer.pluginDataPath(), "witcher1", "previews")
+        )
+        self._register_feature(BasicGameSaveGameInfo(self._getPreview))
         return True
 
+    def settings(self) -> list[mobase.PluginSetting]:
+        return [
+            mobase.PluginSetting(
+                "save_previews",
+                (
+                    "Show the preview image embedded in saves (experimental, the"
+                    " layout of the save resources is not confirmed)"
+                ),
+                False,
+            ),
+        ]
+
+    def _getPreview(self, savepath: Path) -> DeferredPreview | None:
+        if not self._organizer.pluginSetting(self.name(), "save_previews"):
+            return None
+        # looked up, extracted and cached in the worker thread of the widget
+        return lambda: self._previews.get(savepath)
+
     def executables(self) -> List[mobase.ExecutableInfo]:
         path = QFileInfo(self.gameDirectory(), "System/witcher.exe")
         return [mobase.ExecutableInfo("The Witcher", path)]
 
     def listSaves(self, folder: QDir) -> List[mobase.ISaveGame]:
-        return [
-            Witcher1SaveGame(path)
-            for path in Path(folder.absolutePath()).glob("*.TheWitcherSave")
-        ]
+        savesFolder = Path(folder.absolutePath())
+        paths = list(savesFolder.glob("*.TheWitcherSave"))
+        self._previews.prune(savesFolder, paths)
+        return [Witcher1SaveGame(path) for path in paths]
@@ -1,6 +1,6 @@
 from enum import IntEnum, auto
 
-import mobase
+from ...basic_features import BasicModDataContent, ContentRule
 
 
 class Content(IntEnum):
@@ -15,7 +15,7 @@ class Content(IntEnum):
     GAME_SETTINGS = auto()
 
 
-class OblivionRemasteredDataContent(mobase.ModDataContent):
+class OblivionRemasteredDataContent(BasicModDataContent):
     OR_CONTENTS: list[tuple[Content, str, str, bool] | tuple[Content, str, str]] = [
         (Content.PLUGIN, "Plugins (ESM/ESP)", ":/MO/gui/content/plugin"),
         (Content.BSA, "Bethesda Archive", ":/MO/gui/content/bsa"),
@@ -28,82 +28,19 @@ class OblivionRemasteredDataContent(mobase.ModDataContent):
         (Content.GAME_SETTINGS, "Game Settings", ":/MO/gui/content/menu"),
     ]
 
-    def getAllContents(self) -> list[mobase.ModDataContent.Content]:
-        return [
-            mobase.ModDataContent.Content(id, name, icon, *filter_only)
-            for id, name, icon, *filter_only in self.OR_CONTENTS
-        ]
-
-    def getContentsFor(self, filetree: mobase.IFileTree) -> list[int]:
-        contents: set[int] = set()
-
-        for entry in filetree:
-            if isinstance(entry, mobase.IFileTree):
-                match entry.name().casefold():
-                    case "data":
-                        for data_entry in entry:
-                            if data_entry.isFile():
-                                match data_entry.suffix().casefold():
-                                    case "esm" | "esp":
-                                        contents.add(Content.PLUGIN)
-                                    case "bsa":
-                                        contents.add(Content.BSA)
-                                    case _:
-                                        pass
-                            else:
-                                match data_entry.name().casefold():
-                                    case "magicloader":
-                                        contents.add(Content.MAGIC_LOADER)
-                                    case _:
-                                        pass
-                    case "obse":
-                        contents.add(Content.OBSE_FILES)
-                        plugins_dir = entry.find("Plugins")
-                        if isinstance(plugins_dir, mobase.IFileTree):
-                            for plugin_entry in plugins_dir:
-                                if (
-                                    plugin_entry.isFile()
-                                    and plugin_entry.suffix().casefold() == "dll"
-                                ):
-                                    contents.add(Content.OBSE)
-                                if (
-                                    isinstance(plugin_entry, mobase.IFileTree)
-                                    and plugins_dir.name().casefold() == "gamesettings"
-                                ):
-                                    for settings_file in plugin_entry:
-                                        if (
-                                            settings_file.isFile()
-                                            and settings_file.suffix().casefold()
-                                            == "ini"
-                                        ):
-                                            contents.add(Content.GAME_SETTINGS)
-                    case "paks":
-                        contents.add(Content.PAK)
-                        for paks_entry in entry:
-                            if isinstance(paks_entry, mobase.IFileTree):
-                                if paks_entry.name().casefold() == "~mods":
-                                    for mods_entry in paks_entry:
-                                        if isinstance(mods_entry, mobase.IFileTree):
-                                            if (
-                                                "magicloader"
-                                                in mods_entry.name().casefold()
-                                            ):
-                                                contents.add(Content.MAGIC_LOADER)
-                                                break
-                                if paks_entry.name().casefold() == "logicmods":
-                                    contents.add(Content.UE4SS)
-                    case "movies":
-                        contents.add(Content.MOVIE)
-                    case "ue4ss":
-                        contents.add(Content.UE4SS)
-                    case "gamesettings":
-                        for settings_file in entry:
-                            if (
-                                settings_file.isFile()
-                                and settings_file.suffix().casefold() == "ini"
-                            ):
-                                contents.add(Content.GAME_SETTINGS)
-                    case _:
-                        pass
+    OR_RULES: list[ContentRule] = [
+        ContentRule(Content.PLUGIN, "Data", extensions=["esm", "esp"]),
+        ContentRule(Content.BSA, "Data", extensions=["bsa"]),
+        ContentRule(Content.MAGIC_LOADER, "Data", directories=["MagicLoader"]),
+        ContentRule(Content.OBSE_FILES, directories=["OBSE"]),
+        ContentRule(Content.OBSE, "OBSE/Plugins", extensions=["dll"]),
+        ContentRule(Content.PAK, directories=["Paks"]),
+        ContentRule(Content.MAGIC_LOADER, "Paks/~mods", directories=["*MagicLoader*"]),
+        ContentRule(Content.UE4SS, "Paks", directories=["LogicMods"]),
+        ContentRule(Content.MOVIE, directories=["Movies"]),
+        ContentRule(Content.UE4SS, directories=["UE4SS"]),
+        ContentRule(Content.GAME_SETTINGS, "GameSettings", extensions=["ini"]),
+    ]
 
-        return list(contents)
+    def __init__(self):
+        super().__init__(self.OR_CONTENTS, self.OR_RULES)
@@ -2,39 +2,66 @@
 from __future__ import annotations
 
 import io
+import re
 import struct
-from typing import Optional, Tuple
+import sys
+from array import array
+from typing import Any, Dict, Optional, Tuple
 
 from .XRMath import IVec3
 
+_U8 = struct.Struct("<B")
+_S8 = struct.Struct("<b")
+_U16 = struct.Struct("<H")
+_S16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_S32 = struct.Struct("<i")
+_U64 = struct.Struct("<Q")
+_S64 = struct.Struct("<q")
+_BOOL = struct.Struct("<?")
+_FLOAT = struct.Struct("<f")
+_FVEC3 = struct.Struct("<fff")
+_CHUNK_HEADER = struct.Struct("<II")
+
+# re works directly on the memoryview, unlike bytes.find
+_NUL = re.compile(b"\x00")
+
 
 class XRReader:
-    def __init__(self, buffer: bytes):
-        self._buffer = buffer
+    """Reader over a `memoryview` of the buffer, so that `read` and sub-readers
+    do not copy the underlying data."""
+
+    def __init__(self, buffer: bytes | bytearray | memoryview):
+        self._buffer = memoryview(buffer)
         self._pos = 0
 
     def __len__(self) -> int:
         return len(self._buffer)
 
-    def _read(self, size: int) -> Tuple[bytes, int]:
+    def _read(self, size: int) -> Tuple[memoryview, int]:
         pos = min(len(self._buffer), self._pos + size)
         buffer = self._buffer[self._pos : pos]
         return (buffer, pos)
 
-    def read(self, size: int = -1) -> bytes:
+    def unpack(self, fmt: struct.Struct) -> Tuple[Any, ...]:
+        values = fmt.unpack_from(self._buffer, self._pos)
+        self._pos += fmt.size
+        return values
+
+    def read(self, size: int = -1) -> memoryview:
         if size < 0:
             size = len(self._buffer)
         if len(self._buffer) <= self._pos:
-            return b""
+            return memoryview(b"")
         (buffer, pos) = self._read(size)
         self._pos = pos
         return buffer
 
-    def peek(self, size: int = -1) -> bytes:
+    def peek(self, size: int = -1) -> memoryview:
         if size < 0:
             size = len(self._buffer)
         if len(self._buffer) <= self._pos:
-            return b""
+            return memoryview(b"")
         (buffer, _pos) = self._read(size)
         return buffer
 
@@ -58,91 +85,106 @@ class XRReader:
         return self.elapsed() <= 0
 
     def u8(self) -> int:
-        return int(struct.unpack("<B", self.read(1))[0])
+        return int(self.unpack(_U8)[0])
 
     def s8(self) -> int:
-        return int(struct.unpack("<b", self.read(1))[0])
+        return int(self.unpack(_S8)[0])
 
     def u16(self) -> int:
-        return int(struct.unpack("<H", self.read(2))[0])
+        return int(self.unpack(_U16)[0])
 
     def s16(self) -> int:
-        return int(struct.unpack("<h", self.read(2))[0])
+        return int(self.unpack(_S16)[0])
 
     def u32(self) -> int:
-        return int(struct.unpack("<I", self.read(4))[0])
+        return int(self.unpack(_U32)[0])
 
     def s32(self) -> int:
-        return int(struct.unpack("<i", self.read(4))[0])
+        return int(self.unpack(_S32)[0])
 
     def u64(self) -> int:
-        return int(struct.unpack("<Q", self.read(8))[0])
+        return int(self.unpack(_U64)[0])
 
     def s64(self) -> int:
-        return int(struct.unpack("<q", self.read(8))[0])
+        return int(self.unpack(_S64)[0])
 
     def bool(self) -> bool:
-        return bool(struct.unpack("<?", self.read(1))[0])
+        return bool(self.unpack(_BOOL)[0])
 
     def float(self) -> float:
-        return float(struct.unpack("<f", self.read(4))[0])
+        return float(self.unpack(_FLOAT)[0])
 
     def str(self) -> str:
-        chars = bytearray()
-        while not self.eof():
-            c = self.read(1)
-            if c == b"\x00":
-                return str(chars, "utf-8")
-            else:
-                chars += c
-        return ""
+        match = _NUL.search(self._buffer, self._pos)
+        if match is None:
+            self._pos = max(self._pos, len(self._buffer))
+            return ""
+        end = match.start()
+        value = str(self._buffer[self._pos : end], "utf-8")
+        self._pos = end + 1
+        return value
+
+    def _array(self, typecode: str, count: int) -> list[int]:
+        values: array[int] = array(typecode)
+        size = values.itemsize * count
+        if self._pos + size > len(self._buffer):
+            raise struct.error(
+                f"reading {count} items requires a buffer of {size} bytes,"
+                f" {self.elapsed()} left"
+            )
+        values.frombytes(self._buffer[self._pos : self._pos + size])
+        if sys.byteorder == "big":
+            values.byteswap()
+        self._pos += size
+        return values.tolist()
+
+    def array_u8(self, count: int) -> list[int]:
+        return self._array("B", count)
+
+    def array_u16(self, count: int) -> list[int]:
+        return self._array("H", count)
+
+    def array_u32(self, count: int) -> list[int]:
+        return self._array("I", count)
 
     def fvec3(self) -> IVec3:
-        (f1, f2, f3) = struct.unpack("<fff", self.read(12))
+        (f1, f2, f3) = self.unpack(_FVEC3)
         return IVec3(f1, f2, f3)
 
 
 class XRStream(XRReader):
-    def __init__(self, buffer: bytes):
+    """Chunked stream, top-level chunks are indexed on first lookup."""
+
+    def __init__(self, buffer: bytes | bytearray | memoryview):
         super().__init__(buffer)
-        self.last_pos: int = 0
+        self._chunks: Optional[Dict[int, Tuple[int, int]]] = None
+
+    def _index_chunks(self) -> Dict[int, Tuple[int, int]]:
+        """Map each top-level chunk id to the `(offset, size)` of its data,
+        keeping the first chunk for duplicated ids."""
+        chunks: Dict[int, Tuple[int, int]] = {}
+        buffer = self._buffer
+        pos = 0
+        while pos + _CHUNK_HEADER.size <= len(buffer):
+            (dw_type, dw_size) = _CHUNK_HEADER.unpack_from(buffer, pos)
+            pos += _CHUNK_HEADER.size
+            chunks.setdefault(dw_type & (~(1 << 31)), (pos, dw_size))
+            pos += dw_size
+        return chunks
 
     def find_chunk(self, id: int) -> Optional[int]:
-        dw_type = 0
-        dw_size = 0
-        success = False
-        if self.last_pos != 0:
-            self.seek(self.last_pos)
-            dw_type = self.u32()
-            dw_size = self.u32()
-            if (dw_type & (~(1 << 31))) == id:
-                success = True
-
-        if not success:
-            self.seek(0)
-            while not self.eof():
-                dw_type = self.u32()
-                dw_size = self.u32()
-                if (dw_type & (~(1 << 31))) == id:
-                    success = True
-                    break
-                else:
-                    self.seek(dw_size, io.SEEK_CUR)
-
-            if not success:
-                self.last_pos = 0
-                return None
-
-        if (self._pos + dw_size) < len(self._buffer):
-            self.last_pos = self._pos + dw_size
-        else:
-            self.last_pos = 0
-
+        if self._chunks is None:
+            self._chunks = self._index_chunks()
+        chunk = self._chunks.get(id)
+        if chunk is None:
+            return None
+        (pos, dw_size) = chunk
+        self.seek(pos)
         return dw_size
 
     def open_chunk(self, id: int) -> Optional[XRStream]:
         size = self.find_chunk(id)
         if size and size != 0:
-            data = self.read(size)
-            return XRStream(data)
+            # view on the chunk data, no copy
+            return XRStream(self.read(size))
         return None
@@ -0,0 +1,140 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+
+class XRLZOError(ValueError):
+    pass
+
+
+class XRLZODecoder:
+    """Incremental LZO1X decoder.
+
+    `lzokay` can only decompress a whole buffer at once. This decoder is a lot slower
+    but can be stopped once enough output is available, e.g. to read the beginning
+    of a save without decompressing (and holding) the whole file.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        self._input = memoryview(data)
+        self._ip = 0
+        self._state = -1
+        self.output = bytearray()
+        self.finished = False
+
+    def decompress(self, size: int) -> int:
+        """Decompress until at least `size` bytes are available in `output`, or
+        until the end of the stream.
+
+        Returns:
+            The number of bytes available in `output`.
+
+        Raises:
+            XRLZOError: if the stream is corrupted or truncated.
+        """
+        try:
+            self._decompress(size)
+        except IndexError as e:
+            raise XRLZOError("input overrun") from e
+        return len(self.output)
+
+    def _decompress(self, size: int):
+        src = self._input
+        ip = self._ip
+        out = self.output
+        state = self._state
+
+        if state < 0:
+            # the first instruction can be a literal run of more than 3 bytes
+            if src[0] > 17:
+                length = src[0] - 17
+                out += src[1 : 1 + length]
+                ip = 1 + length
+                state = length if length < 4 else 4
+            else:
+                state = 0
+
+        while not self.finished and len(out) < size:
+            inst = src[ip]
+            ip += 1
+            if inst & 0xC0:
+                # M2: [length:3][distance:3][state:2] [distance:8]
+                distance = (src[ip] << 3) + ((inst >> 2) & 0x7) + 1
+                ip += 1
+                length = (inst >> 5) + 1
+                next_state = inst & 0x3
+            elif inst & 0x20:
+                # M3: [001][length:5] ([length]) [distance:14][state:2]
+                length = (inst & 0x1F) + 2
+                if length == 2:
+                    while src[ip] == 0:
+                        length += 255
+                        ip += 1
+                    length += src[ip] + 31
+                    ip += 1
+                value = src[ip] | (src[ip + 1] << 8)
+                ip += 2
+                next_state = value & 0x3
+                distance = (value >> 2) + 1
+            elif inst & 0x10:
+                # M4: [0001][distance:1][length:3] ([length]) [distance:14][state:2]
+                length = (inst & 0x7) + 2
+                if length == 2:
+                    while src[ip] == 0:
+                        length += 255
+                        ip += 1
+                    length += src[ip] + 7
+                    ip += 1
+                value = src[ip] | (src[ip + 1] << 8)
+                ip += 2
+                next_state = value & 0x3
+                distance = ((inst & 0x8) << 11) + (value >> 2)
+                if distance == 0:
+                    self.finished = True
+                    break
+                distance += 16384
+            elif state == 0:
+                # literal run: [0000][length:4] ([length])
+                length = inst + 3
+                if length == 3:
+                    while src[ip] == 0:
+                        length += 255
+                        ip += 1
+                    length += src[ip] + 15
+                    ip += 1
+                if ip + length > len(src):
+                    raise XRLZOError("input overrun")
+                out += src[ip : ip + length]
+                ip += length
+                state = 4
+                continue
+            elif state < 4:
+                # M1 after a short literal run: 2 bytes
+                distance = (inst >> 2) + (src[ip] << 2) + 1
+                ip += 1
+                length = 2
+                next_state = inst & 0x3
+            else:
+                # M1 after a long literal run: 3 bytes
+                distance = (inst >> 2) + (src[ip] << 2) + 2049
+                ip += 1
+                length = 3
+                next_state = inst & 0x3
+
+            start = len(out) - distance
+            if start < 0:
+                raise XRLZOError("lookbehind overrun")
+            if distance >= length:
+                out += out[start : start + length]
+            else:
+                # overlapping copy, repeat the pattern
+                out += (out[start:] * (length // distance + 1))[:length]
+
+            if next_state:
+                if ip + next_state > len(src):
+                    raise XRLZOError("input overrun")
+                out += src[ip : ip + next_state]
+                ip += next_state
+            state = next_state
+
+        self._ip = ip
+        self._state = state
@@ -0,0 +1,160 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+import struct
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .XRIO import XRReader
+
+
+class XRString:
+    """Null-terminated string field, see `XRReader.str`."""
+
+
+class XRArray:
+    """Count prefixed array field.
+
+    Args:
+        count: struct format of the count, e.g. `"I"`.
+        item: struct format of the items, `"B"`, `"H"` or `"I"`.
+    """
+
+    _readers: dict[str, Callable[[XRReader, int], List[int]]] = {
+        "B": XRReader.array_u8,
+        "H": XRReader.array_u16,
+        "I": XRReader.array_u32,
+    }
+
+    def __init__(self, count: str, item: str):
+        self.count = struct.Struct(f"<{count}")
+        self.read_items = self._readers[item]
+
+
+STR = XRString()
+
+XRFieldFormat = Union[str, XRString, XRArray]
+XRField = Union[
+    Tuple[Optional[str], XRFieldFormat],
+    Tuple[Optional[str], XRFieldFormat, Callable[..., Any]],
+]
+
+_Step = Callable[[XRReader, List[Any]], None]
+
+
+class XRLayout:
+    """Declarative layout of a binary record.
+
+    Each field is a `(name, format)` or `(name, format, convert)` tuple where format
+    is either a struct format (without byte order), `STR` or an `XRArray`. Runs of
+    struct fields are compiled into a single `struct.Struct`. A struct field with
+    several values (e.g. `"3f"`) is read as a tuple, or passed to `convert` as
+    separate arguments.
+    Fields named `None` are read but not returned, e.g. padding (`"x"`) or values
+    that are skipped.
+
+    Example:
+
+        XRLayout(
+            ("name", STR),
+            (None, "x"),
+            ("position", "3f", IVec3),
+            ("restrictions", XRArray("I", "H")),
+        )
+    """
+
+    def __init__(self, *fields: XRField):
+        self.fields = fields
+        self.names = tuple(field[0] for field in fields if field[0] is not None)
+        self._steps: List[_Step] = []
+
+        run: List[XRField] = []
+        for field in fields:
+            if isinstance(field[1], str):
+                run.append(field)
+                continue
+            if run:
+                self._steps.append(self._struct_step(run))
+                run = []
+            if isinstance(field[1], XRString):
+                self._steps.append(self._string_step(field[0] is not None))
+            else:
+                self._steps.append(self._array_step(field[1], field[0] is not None))
+        if run:
+            self._steps.append(self._struct_step(run))
+
+    @staticmethod
+    def _struct_step(fields: List[XRField]) -> _Step:
+        fmt = struct.Struct("<" + "".join(str(field[1]) for field in fields))
+
+        # (start, end, convert) of each returned value in the unpacked tuple
+        slices: List[Tuple[int, int, Optional[Callable[..., Any]]]] = []
+        start = 0
+        for field in fields:
+            field_fmt = struct.Struct(f"<{field[1]}")
+            end = start + len(field_fmt.unpack(bytes(field_fmt.size)))
+            if field[0] is not None:
+                convert = field[2] if len(field) == 3 else None
+                slices.append((start, end, convert))
+            start = end
+
+        if all(end - start == 1 and convert is None for start, end, convert in slices):
+            # no conversion, values can be returned as-is
+            if len(slices) == start:
+
+                def step(reader: XRReader, values: List[Any]):
+                    values.extend(reader.unpack(fmt))
+
+                return step
+
+            indices = [start for start, _end, _convert in slices]
+
+            def step_select(reader: XRReader, values: List[Any]):
+                unpacked = reader.unpack(fmt)
+                values.extend([unpacked[index] for index in indices])
+
+            return step_select
+
+        def step_convert(reader: XRReader, values: List[Any]):
+            unpacked = reader.unpack(fmt)
+            for start, end, convert in slices:
+                if convert is None:
+                    values.append(
+                        unpacked[start] if end - start == 1 else unpacked[start:end]
+                    )
+                else:
+                    values.append(convert(*unpacked[start:end]))
+
+        return step_convert
+
+    @staticmethod
+    def _string_step(keep: bool) -> _Step:
+        def step(reader: XRReader, values: List[Any]):
+            value = reader.str()
+            if keep:
+                values.append(value)
+
+        return step
+
+    @staticmethod
+    def _array_step(array: XRArray, keep: bool) -> _Step:
+        count = array.count
+        read_items = array.read_items
+
+        def step(reader: XRReader, values: List[Any]):
+            items = read_items(reader, reader.unpack(count)[0])
+            if keep:
+                values.append(items)
+
+        return step
+
+    def read(self, reader: XRReader) -> Tuple[Any, ...]:
+        """Read the record, returns the values of the named fields, in order."""
+        values: List[Any] = []
+        for step in self._steps:
+            step(reader, values)
+        return tuple(values)
+
+    def read_into(self, obj: object, reader: XRReader) -> None:
+        """Read the record and set the named fields as attributes of `obj`."""
+        for name, value in zip(self.names, self.read(reader), strict=True):
+            setattr(obj, name, value)
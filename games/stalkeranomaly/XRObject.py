@@ -1,10 +1,10 @@
 # -*- encoding: utf-8 -*-
 
-import io
 from enum import IntFlag
 from typing import List
 
 from .XRIO import XRReader
+from .XRLayout import STR, XRArray, XRLayout
 from .XRMath import IFlag, IVec3
 from .XRNET import XRNETState
 
@@ -25,6 +25,20 @@ class XRFlag(IntFlag):
 
 
 class XRAbstract:
+    _spawn_layout = XRLayout(
+        ("name", STR),
+        ("name2", STR),
+        (None, "x"),  # temp_gt
+        ("rp", "B"),
+        ("position", "3f", IVec3),
+        ("angle", "3f", IVec3),
+        ("respawn_time", "H"),
+        ("id", "H"),
+        ("id_parent", "H"),
+        ("id_phantom", "H"),
+        ("flags", "H", IFlag),
+    )
+
     def __init__(self, name: str = ""):
         self._valid = False
         self.name = name
@@ -49,17 +63,7 @@ class XRAbstract:
         if spawn != XRFlag.MSG_SPAWN:
             self._valid = False
             return
-        self.name = reader.str()
-        self.name2 = reader.str()
-        reader.seek(1, io.SEEK_CUR)  # temp_gt
-        self.rp = reader.u8()
-        self.position = reader.fvec3()
-        self.angle = reader.fvec3()
-        self.respawn_time = reader.u16()
-        self.id = reader.u16()
-        self.id_parent = reader.u16()
-        self.id_phantom = reader.u16()
-        self.flags = IFlag(reader.u16())
+        self._spawn_layout.read_into(self, reader)
         if self.flags.has(XRFlag.SPAWN_VERSION):
             self.version = reader.u16()
         if self.version == 0:
@@ -76,9 +80,7 @@ class XRAbstract:
             else:
                 cl_size = reader.u8()
             if cl_size > 0:
-                for _ in range(cl_size):
-                    data = reader.u8()
-                    self.client_data.append(data)
+                self.client_data.extend(reader.array_u8(cl_size))
         if self.version > 79:
             self.spawn_id = reader.u16()
         self._valid = True
@@ -88,17 +90,26 @@ class XRAbstract:
 
 
 class XRVisual:
+    _visual_layout = XRLayout(("visual_name", STR), ("flags", "B", IFlag))
+
     def __init__(self):
         self.visual_name = ""
         self.startup_animation = ""
         self.flags = IFlag(0)
 
     def read_visual(self, reader: XRReader, version: int):
-        self.visual_name = reader.str()
-        self.flags = IFlag(reader.u8())
+        self._visual_layout.read_into(self, reader)
 
 
 class XRBoneData:
+    _bones_layout = XRLayout(
+        ("bones_mask", "Q"),
+        ("root_bone", "H"),
+        ("min", "3f", IVec3),
+        ("max", "3f", IVec3),
+        ("bones_count", "H"),
+    )
+
     def __init__(self):
         self.bones_mask = -1
         self.root_bone = 0
@@ -107,11 +118,9 @@ class XRBoneData:
         self.bones: list[XRNETState] = []
 
     def load(self, reader: XRReader):
-        self.bones_mask = reader.u64()
-        self.root_bone = reader.u16()
-        self.min = reader.fvec3()
-        self.max = reader.fvec3()
-        bones_count = reader.u16()
+        (self.bones_mask, self.root_bone, self.min, self.max, bones_count) = (
+            self._bones_layout.read(reader)
+        )
         for _ in range(bones_count):
             bone = XRNETState()
             bone.read(reader, self.min, self.max)
@@ -119,19 +128,36 @@ class XRBoneData:
 
 
 class XRSkeleton:
+    _skeleton_layout = XRLayout(
+        ("visual_animation", STR),
+        ("flags", "B"),
+        ("source_id", "H"),
+    )
+
     def __init__(self):
         self.source_id = -1
         self.saved_bones = XRBoneData()
 
     def read_state(self, reader: XRReader):
-        self.visual_animation = reader.str()
-        flags = IFlag(reader.u8())
-        self.source_id = reader.u16()
-        if flags.has(4):
+        (self.visual_animation, flags, self.source_id) = self._skeleton_layout.read(
+            reader
+        )
+        if IFlag(flags).has(4):
             self.saved_bones.load(reader)
 
 
 class XRObject(XRAbstract):
+    _object_layout = XRLayout(
+        ("graph_id", "H"),
+        ("distance", "f"),
+        ("direct_control", "I", bool),
+        ("node_id", "I"),
+        ("flags", "I"),
+        ("ini_str", STR),
+        ("story_id", "I"),
+        ("spawn_story_id", "I"),
+    )
+
     def __init__(self):
         super().__init__()
         self.graph_id = 0
@@ -150,14 +176,17 @@ class XRObject(XRAbstract):
         self.read_state(reader)
 
     def read_state(self, reader: XRReader):
-        self.graph_id = reader.u16()
-        self.distance = reader.float()
-        self.direct_control = bool(reader.u32())
-        self.node_id = reader.u32()
-        self.flags.set(reader.u32())
-        self.ini_str = reader.str()
-        self.story_id = reader.u32()
-        self.spawn_story_id = reader.u32()
+        (
+            self.graph_id,
+            self.distance,
+            self.direct_control,
+            self.node_id,
+            flags,
+            self.ini_str,
+            self.story_id,
+            self.spawn_story_id,
+        ) = self._object_layout.read(reader)
+        self.flags.set(flags)
 
     def read_update(self, reader: XRReader):
         update = reader.u16()
@@ -181,6 +210,17 @@ class XRDynamicObjectVisual(XRDynamicObject, XRVisual):
 
 
 class XRCreatureAbstract(XRDynamicObjectVisual):
+    _creature_layout = XRLayout(
+        ("team", "B"),
+        ("squad", "B"),
+        ("group", "B"),
+        ("health", "f"),
+        ("dynamic_out", XRArray("I", "H")),
+        ("dynamic_in", XRArray("I", "H")),
+        ("killer_id", "H"),
+        ("death_time", "Q"),
+    )
+
     def __init__(self):
         super().__init__()
         self.team = 0
@@ -194,24 +234,24 @@ class XRCreatureAbstract(XRDynamicObjectVisual):
 
     def read_state(self, reader: XRReader):
         super().read_state(reader)
-        self.team = reader.u8()
-        self.squad = reader.u8()
-        self.group = reader.u8()
-        self.health = reader.float() * 100
-
-        for _ in range(reader.u32()):
-            _id = reader.u16()
-            self.dynamic_out.append(_id)
-
-        for _ in range(reader.u32()):
-            _id = reader.u16()
-            self.dynamic_in.append(_id)
-
-        self.killer_id = reader.u16()
-        self.death_time = reader.u64()
+        self._creature_layout.read_into(self, reader)
+        self.health *= 100
 
 
 class XRTraderAbstract:
+    _trader_layout = XRLayout(
+        ("money", "I"),
+        ("specific_character", STR),
+        ("trader_flags", "I"),
+        ("character_profile", STR),
+        ("community_index", "i"),
+        ("rank", "i"),
+        ("reputation", "i"),
+        ("character_name_str", STR),
+        ("dead_body_can_take", "B"),
+        ("dead_body_closed", "B"),
+    )
+
     def __init__(self):
         self.money = 0
         self.max_item_mass = 0
@@ -228,19 +268,33 @@ class XRTraderAbstract:
         self.trader_flags.remove(XRFlag.TRADER_INFINITE_AMMO)
 
     def read_state(self, reader: XRReader):
-        self.money = reader.u32()
-        self.specific_character = reader.str()
-        self.trader_flags.assign(reader.u32())
-        self.character_profile = reader.str()
-        self.community_index = reader.s32()
-        self.rank = reader.s32()
-        self.reputation = reader.s32()
-        self.character_name_str = reader.str()
-        self.dead_body_can_take = reader.u8() == 1
-        self.dead_body_closed = reader.u8() == 1
+        (
+            self.money,
+            self.specific_character,
+            trader_flags,
+            self.character_profile,
+            self.community_index,
+            self.rank,
+            self.reputation,
+            self.character_name_str,
+            dead_body_can_take,
+            dead_body_closed,
+        ) = self._trader_layout.read(reader)
+        self.trader_flags.assign(trader_flags)
+        self.dead_body_can_take = dead_body_can_take == 1
+        self.dead_body_closed = dead_body_closed == 1
 
 
 class XRCreatureActor(XRCreatureAbstract, XRTraderAbstract, XRSkeleton):
+    _update_layout = XRLayout(
+        ("state", "H"),
+        (None, "Hf"),  # acceleration (r_sdir)
+        (None, "Hf"),  # velocity (r_sdir)
+        ("radiation", "f"),
+        ("weapon", "B"),
+        ("num_items", "H"),
+    )
+
     def __init__(self):
         XRCreatureAbstract.__init__(self)
         XRTraderAbstract.__init__(self)
@@ -265,13 +319,4 @@ class XRCreatureActor(XRCreatureAbstract, XRTraderAbstract, XRSkeleton):
     def read_update(self, reader: XRReader):
         XRCreatureAbstract.read_update(self, reader)
         # XRTraderAbstract.read_update(self, reader)  # Future?
-        self.state = reader.u16()
-        # acceleration (r_sdir)
-        reader.seek(2, io.SEEK_CUR)  # u16
-        reader.seek(4, io.SEEK_CUR)  # float
-        # velocity (r_sdir)
-        reader.seek(2, io.SEEK_CUR)  # u16
-        reader.seek(4, io.SEEK_CUR)  # float
-        self.radiation = reader.float()
-        self.weapon = reader.u8()
-        self.num_items = reader.u16()
+        self._update_layout.read_into(self, reader)
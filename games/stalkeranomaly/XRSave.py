@@ -1,84 +1,106 @@
+from __future__ import annotations
+
 import io
 import struct
+from bisect import bisect_left
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import BinaryIO, Optional, cast
 
 import lzokay  # pyright: ignore[reportMissingTypeStubs]
 
 from .XRIO import XRReader, XRStream
+from .XRLZO import XRLZODecoder, XRLZOError
 from .XRObject import XRCreatureActor, XRFlag
 
 
 class XRSave:
     filepath: Path
-    player: XRCreatureActor
-
-    _factions = {
-        0: "Loner",
-        1: "Monster",
-        2: "Trader",
-        3: "Army",
-        4: "Sin",
-        5: "Bandit",
-        6: "Duty",
-        7: "Ecologist",
-        8: "Freedom",
-        9: "Mercenary",
-        10: "Army",
-        11: "Monolith",
-        12: "Sin",
-        13: "Loner",
-        14: "Zombified",
-        15: "Clear Sky",
-        16: "UNISG",
-        17: "Renegade",
-        18: "Loner",
-        19: "Bandit",
-        20: "Duty",
-        21: "Freedom",
-        22: "Clear Sky",
-        23: "Ecologist",
-        24: "Mercenary",
-        25: "Military",
-        26: "Monolith",
-        27: "Zombified",
-        28: "Sin",
-        29: "UNISG",
-        30: "Renegade",
-        31: "Participant",
-    }
-
-    _ranks = {
-        1999: "Novice",
-        3999: "Trainee",
-        6999: "Experienced",
-        9999: "Professional",
-        14999: "Veteran",
-        20999: "Expert",
-        27999: "Master",
-        "max": "Legend",
-    }
-
-    _reputation = {
-        -2000: "Terrible",
-        -1500: "Really Bad",
-        -1000: "Very Bad",
-        -500: "Bad",
-        499: "Netural",
-        999: "Good",
-        1499: "Very Good",
-        1999: "Really Good",
-        "max": "Excellent",
-    }
+
+    # indexed by community index
+    _factions = (
+        "Loner",
+        "Monster",
+        "Trader",
+        "Army",
+        "Sin",
+        "Bandit",
+        "Duty",
+        "Ecologist",
+        "Freedom",
+        "Mercenary",
+        "Army",
+        "Monolith",
+        "Sin",
+        "Loner",
+        "Zombified",
+        "Clear Sky",
+        "UNISG",
+        "Renegade",
+        "Loner",
+        "Bandit",
+        "Duty",
+        "Freedom",
+        "Clear Sky",
+        "Ecologist",
+        "Mercenary",
+        "Military",
+        "Monolith",
+        "Zombified",
+        "Sin",
+        "UNISG",
+        "Renegade",
+        "Participant",
+    )
+
+    # upper bounds (inclusive), with one more name for values above the last one
+    _rank_thresholds = (1999, 3999, 6999, 9999, 14999, 20999, 27999)
+    _ranks = (
+        "Novice",
+        "Trainee",
+        "Experienced",
+        "Professional",
+        "Veteran",
+        "Expert",
+        "Master",
+        "Legend",
+    )
+
+    _reputation_thresholds = (-2000, -1500, -1000, -500, 499, 999, 1499, 1999)
+    _reputation = (
+        "Terrible",
+        "Really Bad",
+        "Very Bad",
+        "Bad",
+        "Netural",
+        "Good",
+        "Very Good",
+        "Really Good",
+        "Excellent",
+    )
+
+    _partial_limit = 1 << 19
+    """Maximum offset of the object chunk for `decompressHead`, beyond that the
+    pure Python decoder is slower than decompressing the whole save."""
+
+    _partial_threshold = 16 << 20
+    """Minimum decompressed size of a save for `decompressHead`, smaller saves are
+    faster to decompress whole with lzokay (see `benchmarks/xr_save.py`)."""
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
         self.fetchInfo()
-        with open(filepath, "rb") as file:
-            stream = self.readFile(file)
+
+    @cached_property
+    def player(self) -> Optional[XRCreatureActor]:
+        """The player actor, the save is only decompressed and parsed on first
+        access."""
+        with open(self.filepath, "rb") as file:
+            stream = self.readFile(file, partial=True)
             if stream:
-                self.readObject(stream)
+                return self.readObject(stream)
+        return None
 
     def fetchInfo(self):
         self.splitInfo()
@@ -99,13 +121,26 @@ class XRSave:
         else:
             self.save_fmt = "Unknown"
 
-    def readFile(self, file: BinaryIO) -> Optional[XRStream]:
+    def readFile(self, file: BinaryIO, partial: bool = False) -> Optional[XRStream]:
+        """
+        Args:
+            file: The save file.
+            partial (optional): Only decompress the save up to the player actor if it
+                is larger than `_partial_threshold`, see `decompressHead`, falling
+                back to the whole save if that fails.
+        """
         size = self.filepath.stat().st_size
         if size < 8:
             return None
 
         (start, version, source) = struct.unpack("@iii", file.read(12))
         if (start == -1) and (version >= 6):
+            if partial and source >= self._partial_threshold:
+                # LZO1X never expands the data by more than 1/16th, so this is
+                # enough input for the output decompressHead can produce
+                head = self.decompressHead(file.read(2 * self._partial_limit))
+                if head is not None:
+                    return XRStream(head)
             file.seek(12)
             data = file.read(size - 12)
             return XRStream(
@@ -119,7 +154,44 @@ class XRSave:
 
         return None
 
-    def readObject(self, stream: XRStream):
+    def decompressHead(self, data: bytes) -> Optional[bytearray]:
+        """Decompress the beginning of a save, up to the end of the player actor
+        packets (the first object of `CHUNK_OBJECT`).
+
+        Args:
+            data: The compressed save, or its beginning.
+
+        Returns:
+            The beginning of the decompressed save, with a truncated object chunk,
+            or None if the object chunk does not start within `_partial_limit` bytes
+            or the data could not be decompressed.
+        """
+        decoder = XRLZODecoder(data)
+        output = decoder.output
+
+        def available(size: int) -> bool:
+            return decoder.decompress(size) >= size
+
+        try:
+            pos = 0
+            while pos + 8 <= self._partial_limit:
+                if not available(pos + 8):
+                    return None
+                (dw_type, dw_size) = struct.unpack_from("<II", output, pos)
+                pos += 8
+                if (dw_type & (~(1 << 31))) == XRFlag.CHUNK_OBJECT:
+                    pos += 4  # obj_count
+                    for _ in range(2):  # spawn and update packets
+                        if not available(pos + 2):
+                            return None
+                        pos += 2 + struct.unpack_from("<H", output, pos)[0]
+                    return output if available(pos) else None
+                pos += dw_size
+        except XRLZOError:
+            return None
+        return None
+
+    def readObject(self, stream: XRStream) -> Optional[XRCreatureActor]:
         chunk = stream.open_chunk(XRFlag.CHUNK_OBJECT)
         if chunk:
             chunk.seek(4, io.SEEK_CUR)  # obj_count
@@ -131,34 +203,25 @@ class XRSave:
             update = XRReader(chunk.read(count_update))
             actor.read_update(update)
             if actor:
-                self.player = actor
+                return actor
         return None
 
     def getFaction(self) -> str:
         player = self.player
-        if player:
-            player_faction = player.community_index
-            for faction in self._factions:
-                if player_faction == faction:
-                    return self._factions[faction]
+        if player and 0 <= player.community_index < len(self._factions):
+            return self._factions[player.community_index]
         return "Unknown"
 
     def getRank(self) -> str:
         player = self.player
         if player:
-            player_rank = player.rank
-            for rank in self._ranks:
-                if isinstance(rank, int):
-                    if player_rank <= rank:
-                        return self._ranks[rank]
-        return self._ranks["max"]
+            return self._ranks[bisect_left(self._rank_thresholds, player.rank)]
+        return self._ranks[-1]
 
     def getReputation(self) -> str:
         player = self.player
         if player:
-            player_rep = player.reputation
-            for rep in self._reputation:
-                if isinstance(rep, int):
-                    if player_rep <= rep:
-                        return self._reputation[rep]
-        return self._reputation["max"]
+            return self._reputation[
+                bisect_left(self._reputation_thresholds, player.reputation)
+            ]
+        return self._reputation[-1]
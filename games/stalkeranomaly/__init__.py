@@ -1,4 +1,6 @@
 from .XRIO import XRReader, XRStream
+from .XRLayout import XRArray, XRLayout, XRString
+from .XRLZO import XRLZODecoder, XRLZOError
 from .XRMath import IFlag, IVec3, IVec4
 from .XRNET import XRNETState
 from .XRObject import (
@@ -21,18 +23,23 @@ __all__ = [
     "IVec3",
     "IVec4",
     "XRAbstract",
+    "XRArray",
     "XRBoneData",
     "XRCreatureAbstract",
     "XRCreatureActor",
     "XRDynamicObject",
     "XRDynamicObjectVisual",
     "XRFlag",
+    "XRLayout",
+    "XRLZODecoder",
+    "XRLZOError",
     "XRNETState",
     "XRObject",
     "XRReader",
     "XRSave",
     "XRSkeleton",
     "XRStream",
+    "XRString",
     "XRTraderAbstract",
     "XRVisual",
 ]